@@ -29,17 +29,56 @@ Example usage:
     >>> result = Dice.roll("2d6 + 1d4 x 2 - 1")
 """
 
-from .debug_logger import DebugLogger, StringLogger
-from .dice import Dice, RollModifier, RollResultSet
-from .errors import DivisionByZeroError, InfiniteConditionError, ParseError
-from .expression_token import TokenType
-from .roll_result import RollResult
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .debug_logger import DebugLogger, StringLogger
+    from .dice import Dice, RollModifier, RollResultBatch, RollResultSet
+    from .errors import DivisionByZeroError, InfiniteConditionError, ParseError
+    from .expression_token import TokenType
+    from .roll_result import RollResult
 
 __version__ = "0.0.3"
 __author__ = "The Wyrd One"
 __email__ = "wyrdbound@proton.me"
 __description__ = "A comprehensive dice rolling library for tabletop RPGs"
 
+# Public names and the submodule that defines each. They are imported on
+# first access (PEP 562), so e.g. using only StringLogger or the error
+# classes doesn't load the parser and evaluator.
+_LAZY_IMPORTS = {
+    "DebugLogger": ".debug_logger",
+    "StringLogger": ".debug_logger",
+    "Dice": ".dice",
+    "RollModifier": ".dice",
+    "RollResultSet": ".dice",
+    "RollResultBatch": ".dice",
+    "DivisionByZeroError": ".errors",
+    "InfiniteConditionError": ".errors",
+    "ParseError": ".errors",
+    "TokenType": ".expression_token",
+    "RollResult": ".roll_result",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache it so later lookups don't come back here
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+# Dice.roll, bound on the first call to roll()
+_dice_roll = None
+
 
 # Convenience function for easier access
 def roll(expression, modifiers=None, debug=False, debug_logger=None, rng=None):
@@ -60,13 +99,19 @@ def roll(expression, modifiers=None, debug=False, debug_logger=None, rng=None):
     Returns:
         RollResult: The result of the dice roll
     """
-    return Dice.roll(expression, modifiers, debug, debug_logger, rng)
+    global _dice_roll
+    if _dice_roll is None:
+        from .dice import Dice
+
+        _dice_roll = Dice.roll
+    return _dice_roll(expression, modifiers, debug, debug_logger, rng)
 
 
 __all__ = [
     "Dice",
     "RollResult",
     "RollResultSet",
+    "RollResultBatch",
     "RollModifier",
     "ParseError",
     "DivisionByZeroError",
@@ -1,90 +1,139 @@
 """Debug logging utilities for wyrdbound_dice."""
 
 import logging
-import sys
-from typing import Any, Optional
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+
+def _accepts_debug(logger: Any) -> bool:
+    """Check whether a logger backend would emit DEBUG messages.
+
+    Standard library loggers are asked via ``isEnabledFor``; any other object
+    implementing the logging interface is assumed to accept everything.
+    """
+    if isinstance(logger, logging.Logger):
+        return logger.isEnabledFor(logging.DEBUG)
+    return True
+
+
+class _StdoutWriter:
+    """Default logger backend that prints messages to stdout.
+
+    Debug output is plain text, so this skips the record creation, level
+    checks and handler locking of a full ``logging.Logger``.
+    """
+
+    __slots__ = ()
+
+    def debug(self, message: str, *args: Any) -> None:
+        """Print a message, applying %-style arguments if given."""
+        print(message % args if args else message)
+
+    info = warning = error = debug
+
+
+def _formats_lazily(logger: Any) -> bool:
+    """Check whether a logger backend applies %-style arguments itself.
+
+    Standard library loggers only format a record when a handler emits it.
+    Other backends only promise ``debug(message)``, so they get messages
+    that are already formatted.
+    """
+    return isinstance(logger, (logging.Logger, logging.LoggerAdapter, _StdoutWriter))
+
+
+# Prefix added to every debug message
+DEBUG_PREFIX = "DEBUG: "
 
 
 class DebugLogger:
-    """A debug logger that can use Python's standard logging interface."""
+    """A debug logger that can use Python's standard logging interface.
+
+    ``enabled`` is False when debugging is off or when a standard library
+    logger would discard DEBUG records anyway. Callers that need to build
+    expensive arguments should check it first.
+
+    Instances use ``__slots__``; subclasses that don't declare their own
+    ``__slots__`` get a regular ``__dict__`` back.
+    """
+
+    __slots__ = ("enabled", "logger", "_requested", "_lazy_format", "_debug")
 
     def __init__(self, enabled: bool = False, logger: Optional[logging.Logger] = None):
-        self.enabled = enabled
         if logger is None:
-            # Create a default logger that outputs to stdout
-            self.logger = logging.getLogger("wyrdbound_dice.debug")
-            # Clear any existing handlers to avoid duplication
-            self.logger.handlers.clear()
-            handler = logging.StreamHandler(sys.stdout)
-            handler.setFormatter(logging.Formatter("%(message)s"))
-            self.logger.addHandler(handler)
-            self.logger.setLevel(logging.DEBUG)
-            # Prevent propagation to avoid duplicate messages
-            self.logger.propagate = False
-        else:
-            self.logger = logger
+            # Default to printing straight to stdout
+            logger = _StdoutWriter()
+        # Whether debugging was asked for, whatever the backend accepts
+        self._requested = enabled
+        self.set_logger(logger)
 
     def set_logger(self, logger: logging.Logger) -> None:
         """Set a custom logger backend."""
         self.logger = logger
+        # Bound once so each message skips two attribute lookups
+        self._debug = logger.debug
+        self._lazy_format = _formats_lazily(logger)
+        self.enabled = self._requested and _accepts_debug(logger)
+
+    def log(self, message: str, *args: Any) -> None:
+        """Log a %-style debug message if debugging is enabled.
+
+        Arguments are only interpolated when the message is emitted, so pass
+        values as arguments rather than formatting them into ``message``.
+        """
+        if not self.enabled:
+            return
+        message = DEBUG_PREFIX + message
+        if self._lazy_format:
+            self._debug(message, *args)
+        else:
+            self._debug(message % args if args else message)
+
+
+class _NullDebugLogger(DebugLogger):
+    """Debug logger used while debugging is off.
+
+    ``log`` is a no-op, so disabled call sites pay for a bare method call
+    instead of an ``enabled`` check. It never builds a logging
+    backend.
+    """
+
+    __slots__ = ()
+
+    def __init__(self):
+        self.enabled = False
+        self._requested = False
+        self.logger = None
+        self._debug = None
+        self._lazy_format = False
 
     def log(self, message: str, *args: Any) -> None:
-        """Log a debug message if debugging is enabled."""
-        if self.enabled:
-            formatted_message = message.format(*args) if args else message
-            self.logger.debug(f"DEBUG: {formatted_message}")
-
-    def log_step(self, step: str, description: str) -> None:
-        """Log a processing step with standardized formatting."""
-        if self.enabled:
-            self.logger.debug(f"DEBUG: [{step}] {description}")
-
-    def log_expression(self, label: str, expression: str) -> None:
-        """Log an expression with a label."""
-        if self.enabled:
-            self.logger.debug(f"DEBUG: {label}: '{expression}'")
-
-    def log_tokens(self, tokens: list) -> None:
-        """Log tokenization results."""
-        if self.enabled:
-            token_strs = [str(token) for token in tokens]
-            self.logger.debug(f"DEBUG: Tokens: {token_strs}")
-
-    def log_roll(self, dice_type: str, result: Any) -> None:
-        """Log individual dice roll results."""
-        if self.enabled:
-            self.logger.debug(f"DEBUG: Rolling {dice_type}: {result}")
-
-    def log_calculation(self, operation: str, operands: list, result: Any) -> None:
-        """Log calculation steps."""
-        if self.enabled:
-            operand_strs = [str(op) for op in operands]
-            self.logger.debug(f"DEBUG: {operation} {' '.join(operand_strs)} = {result}")
+        """Discard the message."""
+
+
+_NULL_DEBUG_LOGGER = _NullDebugLogger()
 
 
 class StringLogger:
     """A logger that captures messages to a string buffer for
     testing/API purposes.
-    """
 
-    def __init__(self):
-        self.messages = []
+    Only the most recent ``max_messages`` messages are kept so a long-lived
+    logger can't grow without bound; pass None to keep everything.
+    """
 
-    def debug(self, message: str) -> None:
-        """Log a debug message to the string buffer."""
-        self.messages.append(message)
+    __slots__ = ("messages",)
 
-    def info(self, message: str) -> None:
-        """Log an info message to the string buffer."""
-        self.messages.append(message)
+    def __init__(self, max_messages: Optional[int] = 10_000):
+        self.messages = deque(maxlen=max_messages)
 
-    def warning(self, message: str) -> None:
-        """Log a warning message to the string buffer."""
+    def debug(self, message: str) -> None:
+        """Log a message to the string buffer."""
         self.messages.append(message)
 
-    def error(self, message: str) -> None:
-        """Log an error message to the string buffer."""
-        self.messages.append(message)
+    # All levels share the same buffer
+    info = warning = error = debug
 
     def get_logs(self) -> str:
         """Get all logged messages as a single string."""
@@ -95,30 +144,30 @@ class StringLogger:
         self.messages.clear()
 
 
-# Global debug logger instance
-_debug_logger: Optional[DebugLogger] = None
+# Debug logger for the current thread or async task. Concurrent rolls each
+# see their own debug setting.
+_debug_logger: "ContextVar[DebugLogger]" = ContextVar(
+    "wyrdbound_dice_debug_logger", default=_NULL_DEBUG_LOGGER
+)
 
 
-def get_debug_logger() -> DebugLogger:
-    """Get the global debug logger instance."""
-    global _debug_logger
-    if _debug_logger is None:
-        _debug_logger = DebugLogger(False)
-    return _debug_logger
+# Get the debug logger for the current context. This is the ContextVar's
+# own getter rather than a wrapper function, so the call made on every roll
+# runs no Python frame. The null logger default means it never returns None.
+get_debug_logger: Callable[[], DebugLogger] = _debug_logger.get
 
 
 def set_debug_mode(enabled: bool, logger: Optional[logging.Logger] = None) -> None:
-    """Enable or disable debug mode globally, optionally with a
-    custom logger.
+    """Enable or disable debug mode for the current context, optionally
+    with a custom logger.
     """
-    global _debug_logger
-    _debug_logger = DebugLogger(enabled, logger)
+    _debug_logger.set(DebugLogger(True, logger) if enabled else _NULL_DEBUG_LOGGER)
 
 
 def configure_debug_logger(logger: logging.Logger) -> None:
-    """Configure the global debug logger to use a custom logger backend."""
-    global _debug_logger
-    if _debug_logger is None:
-        _debug_logger = DebugLogger(False, logger)
+    """Configure the current debug logger to use a custom logger backend."""
+    current = _debug_logger.get()
+    if current is _NULL_DEBUG_LOGGER:
+        _debug_logger.set(DebugLogger(False, logger))
     else:
-        _debug_logger.set_logger(logger)
+        current.set_logger(logger)
@@ -1,12 +1,23 @@
+import operator
 import random
 import re
+import sys
+from array import array
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Callable, Dict, List, Optional, Tuple, Union
 
+from .debug_logger import DebugLogger, get_debug_logger, set_debug_mode
 from .errors import DivisionByZeroError, InfiniteConditionError, ParseError
-from .expression_lexer import ExpressionLexer
-from .expression_parser import ExpressionParser
-from .expression_token import TokenType
-from .roll_result import RollResult
+from .expression_lexer import ExpressionLexer, tokenize
+from .expression_parser import ExpressionParser, ParsedExpression
+from .expression_program import ExpressionProgram, ProgramCompiler
+from .roll_result import (
+    KeepOperationProcessor,
+    PackedRolls,
+    RollResult,
+    _pack_rolls,
+)
 
 # Constants
 FUDGE_SIDES = 6
@@ -14,36 +25,161 @@ FUDGE_NEGATIVE_MAX = 2
 FUDGE_BLANK_MAX = 4
 DEFAULT_KEEP_COUNT = 1
 
-# Dice system shorthand expansions
-SHORTHAND_EXPANSIONS = {
-    "FUDGE": "4dF",
-    "BOON": "3d6kh2",
-    "BANE": "3d6kl2",
-    "FLUX": "1d6 - 1d6",
-    "PERC": "1d%",
-    "PERCENTILE": "1d%",
-}
 
-# Comparison operators for dice conditions
+def _fudge_value(raw_value: int) -> int:
+    """Map a raw d6 roll to a fudge die face (-1, 0 or +1)."""
+    if raw_value <= FUDGE_NEGATIVE_MAX:
+        return -1
+    if raw_value <= FUDGE_BLANK_MAX:
+        return 0
+    return 1
+
+
+# Fudge face for every raw d6 value, so a whole group maps with lookups
+_FUDGE_FACES = {raw: _fudge_value(raw) for raw in range(1, FUDGE_SIDES + 1)}
+
+
+# Dice system shorthand expansions (read-only)
+SHORTHAND_EXPANSIONS = MappingProxyType(
+    {
+        "FUDGE": "4dF",
+        "BOON": "3d6kh2",
+        "BANE": "3d6kl2",
+        "FLUX": "1d6 - 1d6",
+        "PERC": "1d%",
+        "PERCENTILE": "1d%",
+    }
+)
+
+# Any shorthand name, longest first so "PERCENTILE" wins over "PERC"
+_SHORTHAND_RE = re.compile(
+    "|".join(
+        re.escape(name) for name in sorted(SHORTHAND_EXPANSIONS, key=len, reverse=True)
+    ),
+    re.IGNORECASE,
+)
+
+
+def _expand_shorthand(match: "re.Match") -> str:
+    return SHORTHAND_EXPANSIONS[match.group(0).upper()]
+
+
+# The flux variants that roll as a special case rather than expanding
+_SPECIAL_FLUX_RE = re.compile("GOODFLUX|BADFLUX", re.IGNORECASE)
+
+# Comparison operators for dice conditions. The operator module's C
+# functions avoid a Python frame per comparison in reroll/explode loops.
 COMPARISON_OPERATORS = {
-    "<": lambda a, b: a < b,
-    "<=": lambda a, b: a <= b,
-    ">": lambda a, b: a > b,
-    ">=": lambda a, b: a >= b,
-    "=": lambda a, b: a == b,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "=": operator.eq,
+}
+
+# For each comparison operator, whether a condition against target holds
+# for every roll of a die with the given sides, i.e. would never stop
+_MATCHES_EVERY_ROLL = {
+    "<=": lambda sides, target: target >= sides,
+    ">=": lambda sides, target: target <= 1,
+    "<": lambda sides, target: target > sides,
+    ">": lambda sides, target: target < 1,
+    "=": lambda sides, target: sides == 1 and target == 1,
 }
 
+# Negative dice at the start of the expression or after an operator or
+# parenthesis, e.g. "-1d6" or "2 * -1d4". Compiled once at import so the
+# pre-tokenization rewrite doesn't pay for a pattern-cache lookup per roll.
+_NEGATIVE_DICE_RE = re.compile(
+    r"(^|[\+\-\*\/\(\s])\s*-(\d+d(?:\d+|F)[^\s\+\-\*\/\)]*)",
+    re.IGNORECASE,
+)
+
+
+# A bare dice term with no modifiers, e.g. "1d20", " 2d6 ", "4dF" or "1d%"
+_PLAIN_DICE_RE = re.compile(r"\s*[0-9]+d(?:[0-9]+|[fF%])\s*")
+
+
+# Individual keep/drop operations inside a dice term's modifier string,
+# e.g. "kh2kl1" or "dl 1"; spaces are allowed before the count.
+_KEEP_OPERATION_RE = re.compile(r"k([hl])\s*(\d*)", re.IGNORECASE)
+_DROP_OPERATION_RE = re.compile(r"d([hl])\s*(\d*)", re.IGNORECASE)
+
+
+# Reroll limits for the non-numeric reroll counts: no count (or a bare "r")
+# rerolls without limit, "o" rerolls once
+_REROLL_LIMITS = {None: None, "": None, "o": 1}
+
+
+# Patterns used by DiceExpressionValidator.validate_expression_input
+_DICE_LIKE_RE = re.compile(r"\d*d\d*[fF%]?")
+_MATH_ONLY_RE = re.compile(r"^[\d\+\-\*\/\sx\×\÷\(\)\s]+$")
+_DICE_TERM_RE = re.compile(r"\d+d\d*[fF]?[krleh\d<>=]*")
+
+# Malformed expressions as (pattern, required_pattern, error message): a
+# match for pattern is an error unless required_pattern also matches
+_VALIDATION_PATTERNS = tuple(
+    (re.compile(pattern), re.compile(required) if required else None, message)
+    for pattern, required, message in (
+        (r"\bd\d*[fF%]?\b", r"\d+d\d*[fF%]?\b", "missing dice count"),
+        (r"\d+d\s*$", None, "missing die sides"),
+        (r"[\+\-\*\/x×÷]\s*$", None, "trailing operator without operand"),
+        (r"^[\+\*\/x×÷]", None, "leading operator without operand"),
+        (
+            r"[\+\-\*\/x×÷][\s]*[\+\-\*\/x×÷]",
+            None,
+            "double operators not allowed",
+        ),
+        (
+            r"\d+\.\d+d\d+|\d+d\d*\.\d+",
+            None,
+            "invalid decimal in dice expression",
+        ),
+        (r"\d+d0\b", None, "zero-sided dice not allowed"),
+    )
+)
+
+
+# On CPython 3.8 and later, random.randint(a, b) returns
+# a + _randbelow(b - a + 1) from the module's shared Random instance.
+# Calling _randbelow directly draws the same numbers from the same stream,
+# minus randint's and randrange's argument handling. Both names are private,
+# so the shortcut is limited to CPython, where that is how randint is
+# written (test_stdlib_draws_match_random_randint checks it); every other
+# interpreter goes through random.randint.
+_STDLIB_RANDINT = random.randint
+_STDLIB_RANDBELOW = (
+    getattr(getattr(random, "_inst", None), "_randbelow", None)
+    if sys.implementation.name == "cpython"
+    else None
+)
+
+
+def _stdlib_randbelow(span: int) -> Optional[Callable[[int], int]]:
+    """Return stdlib random's _randbelow for drawing from range(span), or None.
+
+    None means the draw must go through random.randint: it has been replaced
+    (e.g. patched by a test), the interpreter isn't CPython, or
+    the range is empty and randint has to raise.
+    """
+    if random.randint is _STDLIB_RANDINT and span > 0:
+        return _STDLIB_RANDBELOW
+    return None
+
 
 def _randint(rng, a: int, b: int) -> int:
     """Return a random integer N such that a <= N <= b.
 
-    When rng is None, falls back to stdlib random.randint(a, b).
+    When rng is None, draws what stdlib random.randint(a, b) would.
     When rng is supplied, uses rng.random() — any object with a
     ``random() -> float`` method returning a value in [0.0, 1.0) is
     accepted (duck-typed; no base class required).
     """
     if rng is None:
-        return random.randint(a, b)
+        randbelow = _stdlib_randbelow(b - a + 1)
+        if randbelow is None:
+            return random.randint(a, b)
+        return randbelow(b - a + 1) + a
     return int(rng.random() * (b - a + 1)) + a
 
 
@@ -51,6 +187,16 @@ class RollModifier:
     """Represents a modifier that can be either a static value or a dice
     expression."""
 
+    __slots__ = (
+        "raw_value",
+        "description",
+        "dice_result",
+        "sign",
+        "value",
+        "is_dice",
+        "dice_expression",
+    )
+
     def __init__(self, value: Union[int, str], description: Optional[str] = None):
         self.raw_value = value
         self.description = description or ""
@@ -118,6 +264,15 @@ class RollModifier:
 class RollResultSet:
     """Represents a collection of dice roll results with optional modifiers."""
 
+    __slots__ = (
+        "results",
+        "modifiers",
+        "_override_total",
+        "_override_description",
+        "_program",
+        "_has_leading_zero_minus",
+    )
+
     def __init__(
         self,
         results: List[RollResult],
@@ -129,21 +284,28 @@ class RollResultSet:
         self.modifiers = modifiers or []
         self._override_total: Optional[int] = None
         self._override_description: Optional[str] = None
+        # Program whose run rolled these results, described on first str()
+        self._program: Optional[ExpressionProgram] = None
+        self._has_leading_zero_minus = False
 
         # Roll any dice modifiers, propagating rng for full reproducibility
         for modifier in self.modifiers:
             modifier.roll(dice_class, rng=rng)
 
+    def _result_totals(self) -> List[int]:
+        """Calculate each dice result's total after its multiply/divide."""
+        totals = []
+        for result in self.results:
+            if result.divide == 0:
+                raise DivisionByZeroError()
+            totals.append((result.subtotal * result.multiply) // result.divide)
+        return totals
+
     @property
     def subtotal(self) -> int:
         """Calculate the subtotal from all dice results before applying
         modifiers."""
-        total = 0
-        for result in self.results:
-            if result.divide == 0:
-                raise DivisionByZeroError()
-            total += (sum(result.kept) * result.multiply) // result.divide
-        return total
+        return sum(self._result_totals())
 
     @property
     def total(self) -> int:
@@ -154,55 +316,224 @@ class RollResultSet:
 
     def __str__(self) -> str:
         """Return a formatted string representation of the roll result."""
+        if self._override_description is None and self._program is not None:
+            self._override_description = self._describe_program()
         if self._override_description is not None:
             return f"{self.total} = {self._override_description}"
 
-        parts = self._build_formula_parts()
-        formula = " ".join(parts)
-        return f"{self.total} = {formula}"
-
-    def _build_formula_parts(self) -> List[str]:
+        # Per-result totals feed both the total and the formula's signs
+        result_totals = self._result_totals()
+        total = sum(result_totals) + sum(modifier.value for modifier in self.modifiers)
+        formula = " ".join(self._build_formula_parts(result_totals))
+        return f"{total} = {formula}"
+
+    def _describe_program(self) -> str:
+        """Describe a precedence-parsed roll, with its modifiers appended."""
+        description = self._program.describe(self.results)
+        if self.modifiers:
+            modifier_strs = [str(mod) for mod in self.modifiers]
+            description += " " + " ".join(modifier_strs)
+        return description
+
+    def _build_formula_parts(
+        self, result_totals: Optional[List[int]] = None
+    ) -> List[str]:
         """Build the formula parts for string representation."""
+        if result_totals is None:
+            result_totals = self._result_totals()
         parts = []
+        leading_zero_minus = self._has_leading_zero_minus
 
         # Add dice results
-        for i, result in enumerate(self.results):
+        for i, (result, result_total) in enumerate(zip(self.results, result_totals)):
             result_str = str(result)
-            result_total = (sum(result.kept) * result.multiply) // result.divide
 
             if i == 0:
                 # Handle special negative dice formatting
                 if (
-                    hasattr(self, "_has_leading_zero_minus")
-                    and self._has_leading_zero_minus
+                    leading_zero_minus
                     and result_total < 0
+                    and result_str.startswith("-")
                 ):
-                    if result_str.startswith("-"):
-                        parts.append(f"0 - {result_str[1:]}")
-                    else:
-                        parts.append(result_str)
+                    parts.append(f"0 - {result_str[1:]}")
                 else:
                     parts.append(result_str)
+            elif result_total < 0:
+                # Remove the negative sign and add our own operator
+                parts.append(f"- {result_str[1:]}")
             else:
-                # Format subsequent results with appropriate operators
-                if result_total < 0:
-                    parts.append(
-                        f"- {result_str[1:]}"
-                    )  # Remove negative and add our own
-                else:
-                    parts.append(f"+ {result_str}")
+                parts.append(f"+ {result_str}")
 
         # Add modifiers
-        for modifier in self.modifiers:
-            parts.append(str(modifier))
+        parts.extend(str(modifier) for modifier in self.modifiers)
 
         return parts
 
 
+class RollResultBatch:
+    """Totals and die faces of many rolls of one expression, stored by column.
+
+    Built by ``Dice.roll_many`` for simulations and statistics, where keeping
+    a RollResultSet per roll would cost far more memory than the numbers
+    themselves. ``totals`` holds each roll's final total, packed like die
+    faces (see ``_pack_rolls``), so it can be summed directly or wrapped
+    without copying by anything that reads the buffer protocol. The faces of
+    every roll's dice results are stored back to back in ``faces``; roll
+    ``i`` owns ``faces[offsets[i]:offsets[i + 1]]``.
+    """
+
+    __slots__ = ("expression", "totals", "faces", "offsets")
+
+    def __init__(
+        self,
+        expression: str,
+        totals: PackedRolls,
+        faces: PackedRolls,
+        offsets: array,
+    ):
+        self.expression = expression
+        self.totals = totals
+        self.faces = faces
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+    def rolls(self, index: int) -> List[int]:
+        """The die faces of one roll, in the order of its dice results."""
+        if index < 0:
+            index += len(self.totals)
+        if not 0 <= index < len(self.totals):
+            raise IndexError("roll index out of range")
+        return list(self.faces[self.offsets[index] : self.offsets[index + 1]])
+
+    def mean(self) -> float:
+        """The average total over every roll in the batch."""
+        if not self.totals:
+            raise ValueError("mean of an empty batch")
+        return sum(self.totals) / len(self.totals)
+
+
+class CompiledExpression:
+    """A dice expression with all roll-independent work already done.
+
+    Normalization, shorthand expansion, validation and parsing depend only on
+    the expression string, so they run once per distinct expression and the
+    result is cached. Rolling a compiled expression only touches the RNG,
+    which makes a single instance safe to share between rolls and threads.
+    """
+
+    __slots__ = ("expr", "program", "dice_specs", "fallback")
+
+    def __init__(
+        self,
+        expr: str,
+        program: Optional[ExpressionProgram] = None,
+        dice_specs: Tuple["DiceSpec", ...] = (),
+    ):
+        self.expr = expr
+        # Compiled opcodes when the precedence parser is used
+        self.program = program
+        # Parsed dice terms when the original method is used
+        self.dice_specs = dice_specs
+        # Original-method compilation of a program that failed to evaluate,
+        # filled in on first use
+        self.fallback: Optional["CompiledExpression"] = None
+
+
+class DiceSpec:
+    """The roll-independent parameters of a single dice term like '4d6kh3'.
+
+    Everything parsed out of the dice regex match (counts, sides, reroll,
+    explode, keep and drop settings) is kept here, so rolling a cached
+    expression never touches the regex match again.
+    """
+
+    __slots__ = (
+        "num",
+        "sides",
+        "sides_str",
+        "is_fudge",
+        "is_percentile",
+        "reroll_count",
+        "reroll_cmp",
+        "reroll_target",
+        "max_rerolls",
+        "explode_cmp",
+        "explode_target",
+        "keep_operations",
+        "drop_operations",
+        "keep_type",
+        "keep_n",
+        "multiply",
+        "divide",
+    )
+
+    def __init__(
+        self,
+        *,
+        num: int,
+        sides: int,
+        sides_str: str,
+        is_fudge: bool,
+        is_percentile: bool,
+        reroll_count: Optional[str],
+        reroll_cmp: Optional[str],
+        reroll_target: Optional[int],
+        max_rerolls: Optional[int],
+        explode_cmp: Optional[str],
+        explode_target: Optional[int],
+        keep_operations: Tuple[Tuple[str, int], ...],
+        drop_operations: Tuple[Tuple[str, int], ...],
+        keep_type: Optional[str],
+        keep_n: Optional[int],
+        multiply: int,
+        divide: int,
+    ):
+        self.num = num
+        self.sides = sides
+        self.sides_str = sides_str
+        self.is_fudge = is_fudge
+        self.is_percentile = is_percentile
+        self.reroll_count = reroll_count
+        self.reroll_cmp = reroll_cmp
+        self.reroll_target = reroll_target
+        self.max_rerolls = max_rerolls
+        self.explode_cmp = explode_cmp
+        self.explode_target = explode_target
+        self.keep_operations = keep_operations
+        self.drop_operations = drop_operations
+        self.keep_type = keep_type
+        self.keep_n = keep_n
+        self.multiply = multiply
+        self.divide = divide
+
+
+class _RngBoundDice:
+    """Dice class handle that rolls expression-tree dice with a fixed rng.
+
+    Expression programs call ``dice_class._roll_single_dice_expression_from_string``
+    while evaluating, which has no rng parameter; this binds one in.
+    """
+
+    __slots__ = ("dice_class", "rng")
+
+    def __init__(self, dice_class, rng):
+        self.dice_class = dice_class
+        self.rng = rng
+
+    def _roll_single_dice_expression_from_string(self, dice_expr: str) -> RollResult:
+        return self.dice_class._roll_single_dice_expression_from_string(
+            dice_expr, rng=self.rng
+        )
+
+
 class Dice:
     """Main dice rolling class with support for complex expressions
     and various dice systems."""
 
+    # _parse_dice_spec unpacks match.groups() positionally, so keep it in
+    # step when adding, removing or reordering groups.
     _dice_re = re.compile(
         r"""(?P<num>\d+)d(?P<sides>\d+|F|%)              # NdM or NdF
             (?P<keep_ops_1>(?:\s*k[hl]\s*\d*)*)?         # optional keep before
@@ -225,84 +556,73 @@ class Dice:
     _cmp_funcs: Dict[str, Callable[[int, int], bool]] = COMPARISON_OPERATORS
 
     @classmethod
-    def _roll_original_method(
-        cls,
-        expr: str,
-        modifiers: Optional[Dict[str, Union[int, str]]] = None,
-        rng=None,
-    ) -> RollResultSet:
-        """Roll dice using the original parsing method for backward
+    def _compile_original(cls, expr: str) -> CompiledExpression:
+        """Prepare an expression for the original parsing method for backward
         compatibility."""
-        from .debug_logger import get_debug_logger
-
         logger = get_debug_logger()
 
-        logger.log_step("ORIGINAL_PARSER", "Using original parsing method")
+        logger.log("[ORIGINAL_PARSER] Using original parsing method")
 
         # Input validation
         DiceExpressionValidator.validate_expression_input(expr)
 
-        # Normalize the expression
-        expr = ExpressionProcessor.normalize_unicode(expr)
-
-        # Handle shorthand expressions
-        expr = ExpressionProcessor.process_shorthands(expr)
+        # Normalize the expression and expand shorthands
+        expr = ExpressionProcessor.preprocess(expr)
 
         # Handle negative dice expressions (convert "-XdY" to "0 - XdY")
         expr = ExpressionProcessor.process_negative_dice(expr)
 
-        # Handle special flux cases
-        if "GOODFLUX_SPECIAL" in expr:
-            logger.log_step("SPECIAL_CASE", "Handling GOODFLUX")
-            return cls._handle_goodflux_roll(rng=rng)
-        elif "BADFLUX_SPECIAL" in expr:
-            logger.log_step("SPECIAL_CASE", "Handling BADFLUX")
-            return cls._handle_badflux_roll(rng=rng)
+        # Special flux cases are rolled by their own handlers
+        if "GOODFLUX_SPECIAL" in expr or "BADFLUX_SPECIAL" in expr:
+            return CompiledExpression(expr)
 
-        results: List[RollResult] = []
+        return cls._compile_dice_terms(expr)
 
-        logger.log_step("DICE_MATCHING", f"Finding dice expressions in: '{expr}'")
+    @classmethod
+    def _compile_dice_terms(cls, expr: str) -> CompiledExpression:
+        """Parse the dice terms of an already normalized and validated
+        expression for the original method."""
+        logger = get_debug_logger()
 
-        # Find all dice expressions and their positions
-        dice_matches = list(cls._dice_re.finditer(expr))
+        logger.log("[DICE_MATCHING] Finding dice expressions in: '%s'", expr)
 
-        logger.log(f"Found {len(dice_matches)} dice expressions")
+        # Find and parse all dice expressions in a single pass
+        dice_specs = tuple(
+            cls._parse_dice_spec(expr, match) for match in cls._dice_re.finditer(expr)
+        )
+
+        logger.log("Found %d dice expressions", len(dice_specs))
 
         # Validate that we found at least some dice expressions
-        if not dice_matches:
-            error_msg = (
-                "No valid dice expressions found in: "
-                if "d" not in expr.lower()
-                else "No valid dice expressions found in: "
-            )
-            raise ParseError(f"{error_msg}{expr}")
-
-        # Check if we have cross-dice operations like "1d6 + 2d8"
-        cross_dice_operations = ["+", "-"]
-        cross_dice_op = None
-
-        # Only check for cross-dice operations if we have multiple dice
-        # expressions
-        if len(dice_matches) >= 2:
-            for op in cross_dice_operations:
-                if op in expr:
-                    cross_dice_op = op
-                    break
-
-        if cross_dice_op and len(dice_matches) >= 2:
-            logger.log_step(
-                "CROSS_DICE",
-                f"Detected cross-dice operations with '{cross_dice_op}'",
-            )
-            # Handle cross-dice operations (e.g., "1d6 + 2d8")
-            for match in dice_matches:
-                dice_result = cls._roll_single_dice_expression(expr, match, rng=rng)
-                results.append(dice_result)
-        else:
-            # Handle normal single or multiple dice of same type
-            for match in dice_matches:
-                dice_result = cls._roll_single_dice_expression(expr, match, rng=rng)
-                results.append(dice_result)
+        if not dice_specs:
+            raise ParseError(f"No valid dice expressions found in: {expr}")
+
+        return CompiledExpression(expr, dice_specs=dice_specs)
+
+    @classmethod
+    def _roll_original_method(
+        cls,
+        compiled: CompiledExpression,
+        modifiers: Optional[Dict[str, Union[int, str]]] = None,
+        rng=None,
+    ) -> RollResultSet:
+        """Roll dice using the original parsing method for backward
+        compatibility."""
+        logger = get_debug_logger()
+
+        expr = compiled.expr
+        dice_specs = compiled.dice_specs
+
+        if logger.enabled and len(dice_specs) >= 2:
+            # Cross-dice operations like "1d6 + 2d8"
+            cross_dice_op = next((op for op in ("+", "-") if op in expr), None)
+            if cross_dice_op:
+                logger.log(
+                    "[CROSS_DICE] Detected cross-dice operations with '%s'",
+                    cross_dice_op,
+                )
+
+        results = [cls._roll_dice_spec(spec, rng=rng) for spec in dice_specs]
 
         # Create modifiers list
         mods = []
@@ -313,23 +633,34 @@ class Dice:
 
         result_set = RollResultSet(results, mods, cls, rng=rng)
 
-        # Handle special display cases
-        if "GOODFLUX_SPECIAL" in expr:
-            # This shouldn't happen here since we handle it earlier, but just
-            # in case
-            pass
-        elif "BADFLUX_SPECIAL" in expr:
-            # This shouldn't happen here since we handle it earlier, but just
-            # in case
-            pass
-
         return result_set
 
     @classmethod
     def _roll_single_dice_expression(cls, expr: str, match, rng=None) -> RollResult:
         """Roll a single dice expression given a regex match."""
-        num = int(match.group("num"))
-        sides_str = match.group("sides")
+        return cls._roll_dice_spec(cls._parse_dice_spec(expr, match), rng=rng)
+
+    @classmethod
+    def _parse_dice_spec(cls, expr: str, match) -> DiceSpec:
+        """Parse and validate a dice regex match without rolling anything."""
+        # Fetch every group in one call, in the order they appear in _dice_re
+        (
+            num_str,
+            sides_str,
+            keep_ops_1,
+            drop_ops_1,
+            multiply_str,
+            divide_str,
+            rc_str,
+            reroll_cmp,
+            reroll_target_str,
+            explode_cmp,
+            explode_target_str,
+            explode_simple_str,
+            keep_ops_2,
+            drop_ops_2,
+        ) = match.groups()
+        num = int(num_str)
 
         # Normalize Unicode characters in sides string for display
         normalized_sides_str = ExpressionLexer.normalize_unicode_chars(sides_str)
@@ -339,21 +670,13 @@ class Dice:
         sides = 6 if is_fudge else (100 if is_percentile else int(normalized_sides_str))
 
         # reroll parameters
-        rc_str = match.group("reroll_count")
-        reroll_cmp = match.group("reroll_cmp")
-        target = (
-            int(match.group("reroll_target")) if match.group("reroll_target") else None
-        )
-        max_rerolls = (
-            None
-            if rc_str == ""
-            else (1 if rc_str == "o" else (int(rc_str) if rc_str else None))
-        )
+        target = int(reroll_target_str) if reroll_target_str else None
+        if rc_str in _REROLL_LIMITS:
+            max_rerolls = _REROLL_LIMITS[rc_str]
+        else:
+            max_rerolls = int(rc_str)
 
         # exploding dice parameters
-        explode_cmp = match.group("explode_cmp")
-        explode_target_str = match.group("explode_target")
-        explode_simple_str = match.group("explode_simple")
         explode_target = None
 
         if explode_target_str is not None:
@@ -387,80 +710,14 @@ class Dice:
                 sides, explode_cmp, explode_target, expr
             )
 
-        rolls: List[int] = []
-        all_rolls: List[int] = []
-        for _ in range(num):
-            count = 0
-            if is_fudge:
-                raw_value, value = DiceRoller.roll_fudge_die(rng=rng)
-                all_rolls.append(raw_value)  # Store raw value for display
-            elif is_percentile:
-                value, tens_roll, ones_roll = DiceRoller.roll_percentile_die(rng=rng)
-                # Store both dice for display
-                all_rolls.append((tens_roll, ones_roll))
-            else:
-                value = DiceRoller.roll_standard_die(sides, rng=rng)
-                all_rolls.append(value)
-
-            # apply rerolls (not applicable to fudge or percentile dice)
-            if not is_fudge and not is_percentile and reroll_cmp and target is not None:
-                while DiceRoller.should_reroll(
-                    value, reroll_cmp, target, cls._cmp_funcs
-                ) and (max_rerolls is None or count < max_rerolls):
-                    count += 1
-                    value = DiceRoller.roll_standard_die(sides, rng=rng)
-                    all_rolls.append(value)
-            elif is_percentile and reroll_cmp and target is not None:
-                while DiceRoller.should_reroll(
-                    value, reroll_cmp, target, cls._cmp_funcs
-                ) and (max_rerolls is None or count < max_rerolls):
-                    count += 1
-                    value, tens_roll, ones_roll = DiceRoller.roll_percentile_die(
-                        rng=rng
-                    )
-                    all_rolls.append((tens_roll, ones_roll))
-
-            # Handle exploding dice (not applicable to fudge or percentile
-            # dice)
-            current_total = value
-            if not is_fudge and not is_percentile and explode_target is not None:
-                while True:
-                    if DiceRoller.should_explode(
-                        value, explode_cmp, explode_target, cls._cmp_funcs
-                    ):
-                        value = DiceRoller.roll_standard_die(sides, rng=rng)
-                        all_rolls.append(value)
-                        current_total += value
-                    else:
-                        break
-
-            rolls.append(current_total)
-
         # Parse multiple keep operations (combine from before and after reroll/explode)
-        keep_ops_1 = match.group("keep_ops_1") or ""
-        keep_ops_2 = match.group("keep_ops_2") or ""
-        keep_ops_str = keep_ops_1 + keep_ops_2
+        keep_ops_str = (keep_ops_1 or "") + (keep_ops_2 or "")
         keep_operations = KeepOperationsParser.parse_keep_operations(keep_ops_str)
 
         # Parse multiple drop operations (combine from before and after reroll/explode)
-        drop_ops_1 = match.group("drop_ops_1") or ""
-        drop_ops_2 = match.group("drop_ops_2") or ""
-        drop_ops_str = drop_ops_1 + drop_ops_2
+        drop_ops_str = (drop_ops_1 or "") + (drop_ops_2 or "")
         drop_operations = DropOperationsParser.parse_drop_operations(drop_ops_str)
 
-        # Debug logging for keep/drop operations
-        from .debug_logger import get_debug_logger
-
-        logger = get_debug_logger()
-        if keep_operations:
-            logger.log_step(
-                "KEEP_OPERATIONS", f"Parsed keep operations: {keep_operations}"
-            )
-        if drop_operations:
-            logger.log_step(
-                "DROP_OPERATIONS", f"Parsed drop operations: {drop_operations}"
-            )
-
         # For backward compatibility, still set legacy keep_type and keep_n
         if keep_operations:
             keep_type = keep_operations[0][0]  # First operation's type
@@ -469,27 +726,119 @@ class Dice:
             keep_type = None
             keep_n = None
 
-        multiply = int(match.group("multiply")) if match.group("multiply") else 1
-        divide = int(match.group("divide")) if match.group("divide") else 1
+        multiply = int(multiply_str or 1)
+        divide = int(divide_str or 1)
+
+        return DiceSpec(
+            num=num,
+            sides=sides,
+            sides_str=normalized_sides_str,
+            is_fudge=is_fudge,
+            is_percentile=is_percentile,
+            reroll_count=rc_str,
+            reroll_cmp=reroll_cmp,
+            reroll_target=target,
+            max_rerolls=max_rerolls,
+            explode_cmp=explode_cmp,
+            explode_target=explode_target,
+            keep_operations=tuple(keep_operations),
+            drop_operations=tuple(drop_operations),
+            keep_type=keep_type,
+            keep_n=keep_n,
+            multiply=multiply,
+            divide=divide,
+        )
+
+    @classmethod
+    def _roll_dice_spec(cls, spec: DiceSpec, rng=None) -> RollResult:
+        """Roll the dice described by a parsed DiceSpec."""
+        num = spec.num
+        sides = spec.sides
+        is_fudge = spec.is_fudge
+        is_percentile = spec.is_percentile
+        reroll_cmp = spec.reroll_cmp
+        target = spec.reroll_target
+        max_rerolls = spec.max_rerolls
+        explode_cmp = spec.explode_cmp
+        explode_target = spec.explode_target
+
+        # Groups where no die depends on an earlier result are rolled in one
+        # batch: plain dice, fudge dice (which never reroll or explode) and
+        # percentile dice without rerolls
+        has_reroll = bool(reroll_cmp and target is not None)
+        if is_fudge:
+            all_rolls, rolls = DiceRoller.roll_fudge_dice(num, rng=rng)
+        elif is_percentile and not has_reroll:
+            rolls, all_rolls = DiceRoller.roll_percentile_dice(num, rng=rng)
+        elif not is_percentile and not has_reroll and explode_target is None:
+            rolls = DiceRoller.roll_standard_dice(sides, num, rng=rng)
+            # Nothing was rerolled, so RollResult shares the rolls for
+            # all_rolls instead of packing a copy
+            all_rolls = None
+        elif not is_percentile:
+            rolls, all_rolls = DiceRoller.roll_standard_dice_with_conditions(
+                sides,
+                num,
+                reroll_cmp if has_reroll else None,
+                target,
+                max_rerolls,
+                explode_cmp,
+                explode_target,
+                cls._cmp_funcs,
+                rng=rng,
+            )
+        else:
+            # Percentile dice with rerolls (they never explode)
+            rerolls = cls._cmp_funcs[reroll_cmp]
+            rolls = []
+            all_rolls = []
+            for _ in range(num):
+                count = 0
+                value, tens_roll, ones_roll = DiceRoller.roll_percentile_die(rng=rng)
+                # Store both dice for display
+                all_rolls.append((tens_roll, ones_roll))
+                while rerolls(value, target) and (
+                    max_rerolls is None or count < max_rerolls
+                ):
+                    count += 1
+                    value, tens_roll, ones_roll = DiceRoller.roll_percentile_die(
+                        rng=rng
+                    )
+                    all_rolls.append((tens_roll, ones_roll))
+                rolls.append(value)
+
+        # Debug logging for keep/drop operations
+        logger = get_debug_logger()
+        if logger.enabled:
+            if spec.keep_operations:
+                logger.log(
+                    "[KEEP_OPERATIONS] Parsed keep operations: %s",
+                    list(spec.keep_operations),
+                )
+            if spec.drop_operations:
+                logger.log(
+                    "[DROP_OPERATIONS] Parsed drop operations: %s",
+                    list(spec.drop_operations),
+                )
 
         return RollResult(
             num,
-            normalized_sides_str,
+            spec.sides_str,
             rolls,
-            keep_type,
-            keep_n,
-            rc_str,
+            spec.keep_type,
+            spec.keep_n,
+            spec.reroll_count,
             reroll_cmp,
             target,
             all_rolls,
-            multiply,
-            divide,
+            spec.multiply,
+            spec.divide,
             explode_target,
             explode_cmp,
             is_fudge=is_fudge,
             is_percentile=is_percentile,
-            keep_operations=keep_operations,
-            drop_operations=drop_operations,
+            keep_operations=list(spec.keep_operations),
+            drop_operations=list(spec.drop_operations),
         )
 
     @classmethod
@@ -497,14 +846,22 @@ class Dice:
         cls, dice_expr: str, rng=None
     ) -> RollResult:
         """Roll a single dice expression from a string like '2d6kh1'."""
+        return cls._roll_dice_spec(cls._dice_spec_from_string(dice_expr), rng=rng)
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _dice_spec_from_string(cls, dice_expr: str) -> DiceSpec:
+        """Parse a dice term like '2d6kh1', memoized on the term string."""
         # Validate the dice expression for common issues
         DiceExpressionValidator.validate_expression_input(dice_expr)
 
-        # Use the existing regex to parse the dice expression
+        # Use the existing regex to parse the dice expression. This is a
+        # prefix match on purpose: the lexer keeps modifiers the regex
+        # doesn't know, like the bare "k3" in "1d6k3", inside the term.
         match = cls._dice_re.match(dice_expr)
         if not match:
             raise ValueError(f"Invalid dice expression: {dice_expr}")
-        return cls._roll_single_dice_expression(dice_expr, match, rng=rng)
+        return cls._parse_dice_spec(dice_expr, match)
 
     @classmethod
     def roll_with_precedence(
@@ -519,29 +876,71 @@ class Dice:
         parser or fall back to the original method based on expression
         complexity.
         """
-        from .debug_logger import get_debug_logger
-
         logger = get_debug_logger()
 
-        logger.log_step("PROCESSING", "Starting expression processing")
+        # Bypass the cache in debug mode so every parsing step gets logged
+        if logger.enabled:
+            compiled = cls._compile_expression(expr)
+        else:
+            compiled = cls._compile(expr)
 
-        # Normalize Unicode characters first
-        expr = ExpressionProcessor.normalize_unicode(expr)
-        logger.log_expression("NORMALIZED", expr)
+        return cls._evaluate(compiled, modifiers, rng=rng)
 
-        # Process shorthands first
-        original_expr = expr
-        expr = ExpressionProcessor.process_shorthands(expr)
-        if expr != original_expr:
-            logger.log_step("SHORTHAND_EXPANSION", f"'{original_expr}' -> '{expr}'")
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _compile(cls, expr: str) -> CompiledExpression:
+        """Compile an expression, memoized on the raw expression string.
 
-        # Handle special flux cases
-        if "GOODFLUX_SPECIAL" in expr:
-            logger.log_step("SPECIAL_CASE", "Handling GOODFLUX")
-            return cls._handle_goodflux_roll(rng=rng)
-        elif "BADFLUX_SPECIAL" in expr:
-            logger.log_step("SPECIAL_CASE", "Handling BADFLUX")
-            return cls._handle_badflux_roll(rng=rng)
+        Compiling is deterministic, so the result is shared by every roll of
+        the same expression; only ``_evaluate`` touches the RNG.
+        """
+        return cls._compile_expression(expr)
+
+    @classmethod
+    def clear_parse_cache(cls) -> None:
+        """Forget every memoized parse, e.g. to measure cold parsing or to
+        start tests from a known state."""
+        cls._compile.cache_clear()
+        cls._plain_dice_spec.cache_clear()
+        cls._dice_spec_from_string.cache_clear()
+        ExpressionProcessor.preprocess.cache_clear()
+
+    @classmethod
+    def parse_cache_info(cls):
+        """Hits, misses and size of the compiled-expression cache, as a
+        functools ``CacheInfo``."""
+        return cls._compile.cache_info()
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _plain_dice_spec(cls, expr: str) -> Optional[DiceSpec]:
+        """Return the DiceSpec of a bare term like '2d6' or '4dF', or None.
+
+        The spec comes from the regular compile, so a plain term rolled this
+        way gives exactly the result (and errors) of the full path.
+        """
+        if not _PLAIN_DICE_RE.fullmatch(expr):
+            return None
+        compiled = cls._compile(expr)
+        if compiled.program is not None or len(compiled.dice_specs) != 1:
+            return None
+        return compiled.dice_specs[0]
+
+    @classmethod
+    def _compile_expression(cls, expr: str) -> CompiledExpression:
+        """Normalize, validate and parse an expression without rolling."""
+        logger = get_debug_logger()
+
+        logger.log("[PROCESSING] Starting expression processing")
+
+        if logger.enabled:
+            expr = ExpressionProcessor.preprocess_logged(expr, logger)
+        else:
+            expr = ExpressionProcessor.preprocess(expr)
+
+        # Special flux cases are rolled by their own handlers
+        if "GOODFLUX_SPECIAL" in expr or "BADFLUX_SPECIAL" in expr:
+            return CompiledExpression(expr)
 
         # Check if we should use the new parser or fall back to original
         needs_precedence_parsing = ExpressionProcessor.should_use_precedence_parsing(
@@ -549,11 +948,17 @@ class Dice:
         )
 
         parser_type = "precedence" if needs_precedence_parsing else "original"
-        logger.log_step("PARSER_SELECTION", f"Using {parser_type} parser")
+        logger.log("[PARSER_SELECTION] Using %s parser", parser_type)
 
-        # If we don't need precedence parsing, use the simpler original method
+        # If we don't need precedence parsing, use the simpler original method.
+        # The expression is already normalized, so only the remaining steps of
+        # _compile_original are needed.
         if not needs_precedence_parsing:
-            return cls._roll_original_method(expr, modifiers, rng=rng)
+            logger.log("[ORIGINAL_PARSER] Using original parsing method")
+            DiceExpressionValidator.validate_expression_input(expr)
+            return cls._compile_dice_terms(
+                ExpressionProcessor.process_negative_dice(expr)
+            )
 
         # Handle negative dice expressions for precedence parser
         expr = ExpressionProcessor.process_negative_dice(expr)
@@ -562,14 +967,51 @@ class Dice:
         DiceExpressionValidator.validate_expression_input(expr)
 
         try:
-            return cls._parse_with_precedence(expr, modifiers, rng=rng)
+            program = ProgramCompiler.compile(cls._parse_with_precedence(expr))
+        except (SyntaxError, AttributeError, TypeError, ParseError) as e:
+            logger.log(
+                "[FALLBACK] Parser error: %s, falling back to original method", e
+            )
+            # Fall back to the original parsing method only for parsing errors.
+            # expr has been through every preprocessing step already.
+            logger.log("[ORIGINAL_PARSER] Using original parsing method")
+            return cls._compile_dice_terms(expr)
+
+        return CompiledExpression(expr, program=program)
+
+    @classmethod
+    def _evaluate(
+        cls,
+        compiled: CompiledExpression,
+        modifiers: Optional[Dict[str, Union[int, str]]] = None,
+        rng=None,
+    ) -> "RollResultSet":
+        """Roll a compiled expression."""
+        logger = get_debug_logger()
+
+        # Handle special flux cases
+        if "GOODFLUX_SPECIAL" in compiled.expr:
+            logger.log("[SPECIAL_CASE] Handling GOODFLUX")
+            return cls._handle_goodflux_roll(rng=rng)
+        elif "BADFLUX_SPECIAL" in compiled.expr:
+            logger.log("[SPECIAL_CASE] Handling BADFLUX")
+            return cls._handle_badflux_roll(rng=rng)
+
+        if compiled.program is None:
+            return cls._roll_original_method(compiled, modifiers, rng=rng)
+
+        try:
+            return cls._evaluate_with_precedence(compiled, modifiers, rng=rng)
         except (SyntaxError, AttributeError, TypeError, ParseError) as e:
-            logger.log_step(
-                "FALLBACK",
-                f"Parser error: {e}, falling back to original method",
+            logger.log(
+                "[FALLBACK] Parser error: %s, falling back to original method", e
             )
-            # Fall back to the original parsing method only for parsing errors
-            return cls._roll_original_method(expr, modifiers, rng=rng)
+            # Fall back to the original parsing method only for parsing errors.
+            # The fallback is compiled once and kept with the expression.
+            fallback = compiled.fallback
+            if fallback is None:
+                fallback = compiled.fallback = cls._compile_dice_terms(compiled.expr)
+            return cls._roll_original_method(fallback, modifiers, rng=rng)
 
     @classmethod
     def roll(
@@ -618,26 +1060,132 @@ class Dice:
             >>> mock_rng.random.return_value = 0.9999
             >>> Dice.roll("1d6", rng=mock_rng)  # Always rolls 6
         """
-        from .debug_logger import get_debug_logger, set_debug_mode
+        if not isinstance(expr, str):
+            raise TypeError(f"Dice expression must be a str, not {type(expr).__name__}")
+        # Debug mode is only set when asked for, so plain rolls leave the
+        # context's logger, and any logger a caller installed, untouched
+        if debug or logger is not None:
+            set_debug_mode(debug, logger)
+        if not debug:
+            if not modifiers:
+                # Bare terms like "1d20" skip expression evaluation entirely
+                spec = cls._plain_dice_spec(expr)
+                if spec is not None:
+                    return RollResultSet(
+                        [cls._roll_dice_spec(spec, rng=rng)], None, cls, rng=rng
+                    )
+            return cls.roll_with_precedence(expr, modifiers, rng=rng)
 
-        # Set debug mode for this roll
-        set_debug_mode(debug, logger)
         debug_logger = get_debug_logger()
+        try:
+            debug_logger.log("[START] Rolling expression: '%s'", expr)
+            if rng is not None:
+                debug_logger.log("[RNG] Custom RNG in use: %s", type(rng).__name__)
+            if modifiers:
+                debug_logger.log("[MODIFIERS] Using modifiers: %s", modifiers)
 
-        debug_logger.log_step("START", f"Rolling expression: '{expr}'")
-        if rng is not None:
-            debug_logger.log_step("RNG", f"Custom RNG in use: {type(rng).__name__}")
-        if modifiers:
-            debug_logger.log_step("MODIFIERS", f"Using modifiers: {modifiers}")
+            result = cls.roll_with_precedence(expr, modifiers, rng=rng)
 
-        result = cls.roll_with_precedence(expr, modifiers, rng=rng)
+            if debug_logger.enabled:
+                debug_logger.log("[COMPLETE] Final result: %s", result.total)
+        finally:
+            # Reset debug mode, even if the roll failed
+            set_debug_mode(False)
 
-        debug_logger.log_step("COMPLETE", f"Final result: {result.total}")
+        return result
 
-        # Reset debug mode
-        set_debug_mode(False)
+    @classmethod
+    def roll_many(
+        cls,
+        expr: str,
+        n: int,
+        modifiers: Optional[Dict[str, Union[int, str]]] = None,
+        rng=None,
+    ) -> RollResultBatch:
+        """Roll an expression n times and keep only the numbers.
 
-        return result
+        Each roll is exactly ``Dice.roll(expr, modifiers, rng=rng)``, in
+        order, so the same random source gives the same totals. The
+        expression is parsed once; the per-roll result objects are dropped
+        as soon as their totals and faces are stored. A lone standard term
+        with at most one keep operation, like "3d6" or "4d6kh3", is drawn in
+        one go and totalled straight from the faces, with no result objects
+        at all.
+
+        Args:
+            expr: The dice expression to evaluate (e.g., "4d6kh3")
+            n: Number of rolls
+            modifiers: Optional additional modifiers as a dictionary
+            rng: Optional random number source, as for ``roll``
+
+        Returns:
+            RollResultBatch with one total per roll
+
+        Examples:
+            >>> batch = Dice.roll_many("4d6kh3", 10_000)
+            >>> batch.mean()
+        """
+        if not isinstance(expr, str):
+            raise TypeError(f"Dice expression must be a str, not {type(expr).__name__}")
+        # Accepts ints and int-like objects; 2.5 or "3" raise a TypeError
+        # here rather than deep inside the rolling loop
+        n = operator.index(n)
+        if n < 0:
+            raise ValueError(f"Number of rolls must not be negative: {n}")
+
+        if n and not modifiers:
+            spec = cls._bulk_dice_spec(expr)
+            if spec is not None:
+                return cls._roll_many_spec(expr, spec, n, rng)
+
+        totals = []
+        faces: List[int] = []
+        offsets = array("q", [0])
+        for _ in range(n):
+            result_set = cls.roll(expr, modifiers, rng=rng)
+            totals.append(result_set.total)
+            for result in result_set.results:
+                faces.extend(result.rolls)
+            offsets.append(len(faces))
+
+        return RollResultBatch(expr, _pack_rolls(totals), _pack_rolls(faces), offsets)
+
+    @classmethod
+    def _bulk_dice_spec(cls, expr: str) -> Optional[DiceSpec]:
+        """Return the DiceSpec of a lone term like '3d6' or '4d6kh3' whose
+        rolls roll_many can total without building results, or None."""
+        compiled = cls._compile(expr)
+        if compiled.program is not None or len(compiled.dice_specs) != 1:
+            return None
+        spec = compiled.dice_specs[0]
+        if (
+            spec.is_fudge
+            or spec.is_percentile
+            or spec.reroll_cmp
+            or spec.explode_target is not None
+            or spec.drop_operations
+            or len(spec.keep_operations) > 1
+            or spec.multiply != 1
+            or spec.divide != 1
+        ):
+            return None
+        return spec
+
+    @classmethod
+    def _roll_many_spec(
+        cls, expr: str, spec: DiceSpec, n: int, rng=None
+    ) -> RollResultBatch:
+        """Roll a bulk-friendly term n times in one draw and total each roll
+        straight from the faces."""
+        num = spec.num
+        # Every die is independent, so drawing all n rolls at once consumes
+        # the random source exactly like rolling them one at a time
+        faces = DiceRoller.roll_standard_dice(spec.sides, num * n, rng=rng)
+        totals = KeepOperationProcessor.kept_sums(
+            faces, n, num, spec.keep_type, spec.keep_n
+        )
+        offsets = array("q", [i * num for i in range(n + 1)])
+        return RollResultBatch(expr, _pack_rolls(totals), _pack_rolls(faces), offsets)
 
     @classmethod
     def _handle_goodflux(cls, expr: str) -> str:
@@ -662,89 +1210,70 @@ class Dice:
         return FluxDiceHandler.roll_flux(False, rng=rng)
 
     @classmethod
-    def _parse_with_precedence(
-        cls,
-        expr: str,
-        modifiers: Optional[Dict[str, Union[int, str]]],
-        rng=None,
-    ) -> "RollResultSet":
+    def _parse_with_precedence(cls, expr: str) -> ParsedExpression:
         """Parse expression using the precedence parser."""
-        from .debug_logger import get_debug_logger
-
         logger = get_debug_logger()
 
-        logger.log_step("TOKENIZING", f"Tokenizing expression: '{expr}'")
+        logger.log("[TOKENIZING] Tokenizing expression: '%s'", expr)
 
         # Tokenize the expression
-        lexer = ExpressionLexer(expr)
-        tokens = []
-        while True:
-            token = lexer.get_next_token()
-            tokens.append(token)
-            if token.type == TokenType.EOF:
-                break
+        tokens = tokenize(expr)
 
-        logger.log_tokens(tokens[:-1])  # Exclude EOF token for cleaner output
+        if logger.enabled:
+            # Exclude EOF token for cleaner output
+            logger.log("Tokens: [%s]", ", ".join(map(str, tokens[:-1])))
 
-        logger.log_step("PARSING", "Parsing tokens with precedence rules")
+        logger.log("[PARSING] Parsing tokens with precedence rules")
 
         # Parse with proper precedence
         parser = ExpressionParser(tokens)
-        parsed_expr = parser.parse()
+        return parser.parse()
 
-        logger.log_step("EVALUATING", "Evaluating parsed expression")
-
-        # Evaluate the expression. The parser calls
-        # dice_class._roll_single_dice_expression_from_string
-        # so we pass a thin proxy that closes over rng.
-        class _DiceProxy:
-            """Proxy that forwards all attribute access to cls, but binds rng
-            into _roll_single_dice_expression_from_string."""
-
-            def __getattr__(self, name):
-                return getattr(cls, name)
+    @classmethod
+    def _evaluate_with_precedence(
+        cls,
+        compiled: CompiledExpression,
+        modifiers: Optional[Dict[str, Union[int, str]]],
+        rng=None,
+    ) -> "RollResultSet":
+        """Evaluate an expression parsed by the precedence parser."""
+        logger = get_debug_logger()
 
-            @staticmethod
-            def _roll_single_dice_expression_from_string(dice_expr):
-                return cls._roll_single_dice_expression_from_string(dice_expr, rng=rng)
+        logger.log("[EVALUATING] Evaluating parsed expression")
 
-        result = parsed_expr.evaluate(_DiceProxy())
+        # Only the value is worked out here; the description is built from
+        # the rolled dice results the first time the result set is printed
+        result_value, dice_results = compiled.program.roll(_RngBoundDice(cls, rng))
 
-        logger.log_step("RESULT", f"Expression evaluated to: {result.value}")
+        logger.log("[RESULT] Expression evaluated to: %s", result_value)
 
         # Create modifiers list
         mods = []
         if modifiers:
-            logger.log_step("MODIFIERS", f"Processing {len(modifiers)} modifiers")
+            logger.log("[MODIFIERS] Processing %d modifiers", len(modifiers))
             for name, value in modifiers.items():
                 mod = RollModifier(value, name)
                 mods.append(mod)
-                logger.log(f"Added modifier '{name}': {mod.value}")
+                logger.log("Added modifier '%s': %s", name, mod.value)
 
         # Create a custom result set that shows the full mathematical
         # expression
-        result_set = RollResultSet(result.dice_results, mods, cls, rng=rng)
+        result_set = RollResultSet(dice_results, mods, cls, rng=rng)
 
         # Override the total calculation to use our evaluated result plus
         # modifiers
         modifier_total = sum(mod.value for mod in mods)
-        final_total = result.value + modifier_total
+        final_total = result_value + modifier_total
         result_set._override_total = final_total
-
-        logger.log_calculation(
-            "TOTAL",
-            [result.value, f"modifiers({modifier_total})"],
-            final_total,
-        )
-
-        # Build description that includes modifiers
-        if mods:
-            modifier_strs = [str(mod) for mod in mods]
-            result_set._override_description = (
-                result.description + " " + " ".join(modifier_strs)
+        result_set._program = compiled.program
+
+        if logger.enabled:
+            logger.log(
+                "TOTAL %s modifiers(%s) = %s",
+                result_value,
+                modifier_total,
+                final_total,
             )
-        else:
-            result_set._override_description = result.description
 
         return result_set
 
@@ -766,12 +1295,9 @@ class KeepOperationsParser:
         if not keep_ops_str:
             return []
 
-        # Pattern to match individual keep operations - handle spaces around
-        # numbers
-        keep_pattern = re.compile(r"k([hl])\s*(\d*)", re.IGNORECASE)
         operations = []
 
-        for match in keep_pattern.finditer(keep_ops_str):
+        for match in _KEEP_OPERATION_RE.finditer(keep_ops_str):
             keep_type = match.group(1).lower()
             keep_n_str = match.group(2).strip() if match.group(2) else ""
             keep_n = int(keep_n_str) if keep_n_str else DEFAULT_KEEP_COUNT
@@ -802,12 +1328,9 @@ class DropOperationsParser:
         if not drop_ops_str:
             return []
 
-        # Pattern to match individual drop operations - handle spaces around
-        # numbers
-        drop_pattern = re.compile(r"d([hl])\s*(\d*)", re.IGNORECASE)
         operations = []
 
-        for match in drop_pattern.finditer(drop_ops_str):
+        for match in _DROP_OPERATION_RE.finditer(drop_ops_str):
             drop_type = match.group(1).lower()
             drop_n_str = match.group(2).strip() if match.group(2) else ""
             drop_n = int(drop_n_str) if drop_n_str else DEFAULT_KEEP_COUNT
@@ -824,6 +1347,8 @@ class DropOperationsParser:
 class GoodFluxResult(RollResult):
     """Special result class for GOODFLUX rolls."""
 
+    __slots__ = ("roll1", "roll2", "higher", "lower")
+
     def __init__(self, roll1: int, roll2: int, higher: int, lower: int):
         # Store the raw rolls in all_rolls
         all_rolls = [roll1, roll2]
@@ -845,6 +1370,8 @@ class GoodFluxResult(RollResult):
 class BadFluxResult(RollResult):
     """Special result class for BADFLUX rolls."""
 
+    __slots__ = ("roll1", "roll2", "higher", "lower")
+
     def __init__(self, roll1: int, roll2: int, higher: int, lower: int):
         # Store the raw rolls in all_rolls
         all_rolls = [roll1, roll2]
@@ -871,8 +1398,7 @@ class FluxDiceHandler:
         roll1: int, roll2: int, is_good_flux: bool
     ) -> "RollResultSet":
         """Create a flux result set from two d6 rolls."""
-        higher = max(roll1, roll2)
-        lower = min(roll1, roll2)
+        higher, lower = (roll1, roll2) if roll1 >= roll2 else (roll2, roll1)
 
         if is_good_flux:
             result = GoodFluxResult(roll1, roll2, higher, lower)
@@ -902,41 +1428,22 @@ class DiceExpressionValidator:
             raise ParseError(f"Empty or whitespace-only expression: {repr(expr)}")
 
         # Check for any dice-like patterns
-        if not re.search(r"\d*d\d*[fF%]?", expr):
-            if re.match(r"^[\d\+\-\*\/\sx\×\÷\(\)\s]+$", expr):
+        if not _DICE_LIKE_RE.search(expr):
+            if _MATH_ONLY_RE.match(expr):
                 pass  # Valid mathematical expression without dice
             else:
                 raise ParseError(f"No valid dice expression found: {expr}")
 
         # Check for malformed dice expressions
-        validation_patterns = [
-            (r"\bd\d*[fF%]?\b", r"\d+d\d*[fF%]?\b", "missing dice count"),
-            (r"\d+d\s*$", None, "missing die sides"),
-            (r"[\+\-\*\/x×÷]\s*$", None, "trailing operator without operand"),
-            (r"^[\+\*\/x×÷]", None, "leading operator without operand"),
-            (
-                r"[\+\-\*\/x×÷][\s]*[\+\-\*\/x×÷]",
-                None,
-                "double operators not allowed",
-            ),
-            (
-                r"\d+\.\d+d\d+|\d+d\d*\.\d+",
-                None,
-                "invalid decimal in dice expression",
-            ),
-            (r"\d+d0\b", None, "zero-sided dice not allowed"),
-        ]
-
-        for pattern, required_pattern, error_msg in validation_patterns:
-            if re.search(pattern, expr):
-                if required_pattern and not re.search(required_pattern, expr):
+        for pattern, required_pattern, error_msg in _VALIDATION_PATTERNS:
+            if pattern.search(expr):
+                if required_pattern and not required_pattern.search(expr):
                     raise ParseError(f"Malformed dice expression - {error_msg}: {expr}")
                 elif not required_pattern:
                     raise ParseError(f"{error_msg.capitalize()}: {expr}")
 
         # Check for multiple explode conditions
-        dice_patterns = re.findall(r"\d+d\d*[fF]?[krleh\d<>=]*", expr)
-        for dice_pattern in dice_patterns:
+        for dice_pattern in _DICE_TERM_RE.findall(expr):
             if dice_pattern.count("e") > 1:
                 raise ParseError(
                     "Multiple explode conditions not allowed in dice "
@@ -951,15 +1458,8 @@ class DiceExpressionValidator:
         Check if a condition would cause infinite loops and raise
         appropriate error.
         """
-        error_conditions = {
-            "<=": target >= sides,
-            ">=": target <= 1,
-            "<": target > sides,
-            ">": target < 1,
-            "=": sides == 1 and target == 1,
-        }
-
-        if error_conditions.get(cmp, False):
+        matches_every_roll = _MATCHES_EVERY_ROLL.get(cmp)
+        if matches_every_roll is not None and matches_every_roll(sides, target):
             range_desc = f"1-{sides}" if sides > 1 else "1"
             raise InfiniteConditionError(
                 condition_type,
@@ -1002,21 +1502,39 @@ class DiceRoller:
             rng: Optional random number source. Any object with a
                 ``random() -> float`` method. When None, stdlib random is used.
         """
-        from .debug_logger import get_debug_logger
-
         raw_value = _randint(rng, 1, 6)
-        if raw_value <= FUDGE_NEGATIVE_MAX:
-            effective_value = -1
-        elif raw_value <= FUDGE_BLANK_MAX:
-            effective_value = 0
-        else:
-            effective_value = 1
+        effective_value = _fudge_value(raw_value)
 
         logger = get_debug_logger()
-        logger.log_roll("1dF", f"{effective_value} (raw: {raw_value})")
+        logger.log("Rolling 1dF: %s (raw: %s)", effective_value, raw_value)
 
         return raw_value, effective_value
 
+    @staticmethod
+    def roll_fudge_dice(count: int, rng=None) -> Tuple[List[int], List[int]]:
+        """Roll a group of fudge dice and return (raw_values, effective_values).
+
+        Produces the same rolls as calling ``roll_fudge_die`` ``count`` times.
+
+        Args:
+            count: Number of dice to roll.
+            rng: Optional random number source. Any object with a
+                ``random() -> float`` method. When None, stdlib random is used.
+        """
+        raw_values = DiceRoller._draw(1, FUDGE_SIDES, count, rng)
+        try:
+            faces = _FUDGE_FACES
+            effective_values = [faces[raw] for raw in raw_values]
+        except (KeyError, TypeError):
+            # Only a substituted random source yields values outside 1-6
+            effective_values = [_fudge_value(raw) for raw in raw_values]
+
+        logger = get_debug_logger()
+        if logger.enabled:
+            for raw, effective in zip(raw_values, effective_values):
+                logger.log("Rolling 1dF: %s (raw: %s)", effective, raw)
+        return raw_values, effective_values
+
     @staticmethod
     def roll_standard_die(sides: int, rng=None) -> int:
         """Roll a standard die with given number of sides.
@@ -1026,13 +1544,124 @@ class DiceRoller:
             rng: Optional random number source. Any object with a
                 ``random() -> float`` method. When None, stdlib random is used.
         """
-        from .debug_logger import get_debug_logger
-
         result = _randint(rng, 1, sides)
         logger = get_debug_logger()
-        logger.log_roll(f"1d{sides}", result)
+        logger.log("Rolling 1d%s: %s", sides, result)
         return result
 
+    @staticmethod
+    def roll_standard_dice(sides: int, count: int, rng=None) -> List[int]:
+        """Roll a group of standard dice with the same number of sides.
+
+        Produces the same rolls as calling ``roll_standard_die`` ``count``
+        times, but resolves the random source once for the whole group.
+
+        Args:
+            sides: Number of faces on each die.
+            count: Number of dice to roll.
+            rng: Optional random number source. Any object with a
+                ``random() -> float`` method. When None, stdlib random is used.
+        """
+        results = DiceRoller._draw(1, sides, count, rng)
+
+        logger = get_debug_logger()
+        if logger.enabled:
+            for result in results:
+                logger.log("Rolling 1d%s: %s", sides, result)
+        return results
+
+    @staticmethod
+    def roll_standard_dice_with_conditions(
+        sides: int,
+        count: int,
+        reroll_cmp: Optional[str],
+        reroll_target: Optional[int],
+        max_rerolls: Optional[int],
+        explode_cmp: Optional[str],
+        explode_target: Optional[int],
+        cmp_funcs: Dict[str, Callable],
+        rng=None,
+    ) -> Tuple[List[int], List[int]]:
+        """Roll standard dice with rerolls and/or explosions.
+
+        Returns (rolls, all_rolls): each die's final total (after rerolls,
+        plus any explosions) and every individual die drawn, in order. Draws
+        the same values as rolling die by die with ``roll_standard_die``, but
+        keeps the random source, comparisons and list appends in locals for
+        the whole group.
+
+        Args:
+            sides: Number of faces on each die.
+            count: Number of dice to roll.
+            reroll_cmp: Reroll comparison operator, or None for no rerolls.
+            reroll_target: Value compared against for rerolls.
+            max_rerolls: Maximum rerolls per die, or None for unlimited.
+            explode_cmp: Explosion comparison operator, or None to explode
+                only on exactly ``explode_target``.
+            explode_target: Explosion target, or None for no explosions.
+            cmp_funcs: Mapping of comparison operators to functions.
+            rng: Optional random number source. Any object with a
+                ``random() -> float`` method. When None, stdlib random is used.
+        """
+        randbelow = _stdlib_randbelow(sides) if rng is None else None
+        if randbelow is not None:
+
+            def draw() -> int:
+                return randbelow(sides) + 1
+
+        elif rng is None:
+            randint = random.randint
+
+            def draw() -> int:
+                return randint(1, sides)
+
+        else:
+            rand = rng.random
+
+            def draw() -> int:
+                return int(rand() * sides) + 1
+
+        rerolls = cmp_funcs[reroll_cmp] if reroll_cmp else None
+        if explode_target is None:
+            explodes = None
+        elif explode_cmp:
+            explodes = cmp_funcs[explode_cmp]
+        else:
+            explodes = operator.eq
+
+        rolls: List[int] = []
+        all_rolls: List[int] = []
+        record = all_rolls.append
+        for _ in range(count):
+            value = draw()
+            record(value)
+
+            if rerolls is not None:
+                rerolled = 0
+                while rerolls(value, reroll_target) and (
+                    max_rerolls is None or rerolled < max_rerolls
+                ):
+                    rerolled += 1
+                    value = draw()
+                    record(value)
+
+            total = value
+            if explodes is not None:
+                while explodes(value, explode_target):
+                    value = draw()
+                    record(value)
+                    total += value
+
+            rolls.append(total)
+
+        logger = get_debug_logger()
+        if logger.enabled:
+            # all_rolls holds every draw in order, so logging afterwards
+            # reproduces the per-die log
+            for value in all_rolls:
+                logger.log("Rolling 1d%s: %s", sides, value)
+        return rolls, all_rolls
+
     @staticmethod
     def roll_percentile_die(rng=None) -> Tuple[int, int, int]:
         """Roll percentile dice and return (total_value, tens_die, ones_die).
@@ -1041,8 +1670,6 @@ class DiceRoller:
             rng: Optional random number source. Any object with a
                 ``random() -> float`` method. When None, stdlib random is used.
         """
-        from .debug_logger import get_debug_logger
-
         tens_die = _randint(rng, 0, 9) * 10  # 0, 10, 20, ..., 90
         ones_die = _randint(rng, 0, 9)  # 0, 1, 2, ..., 9
         total = tens_die + ones_die
@@ -1050,9 +1677,51 @@ class DiceRoller:
         if total == 0:
             total = 100
         logger = get_debug_logger()
-        logger.log_roll("1d%", f"{total} (tens: {tens_die}, ones: {ones_die})")
+        logger.log("Rolling 1d%%: %s (tens: %s, ones: %s)", total, tens_die, ones_die)
         return total, tens_die, ones_die
 
+    @staticmethod
+    def roll_percentile_dice(
+        count: int, rng=None
+    ) -> Tuple[List[int], List[Tuple[int, int]]]:
+        """Roll a group of percentile dice and return (totals, die_pairs).
+
+        ``die_pairs`` holds the (tens, ones) dice of each roll. Produces the
+        same rolls as calling ``roll_percentile_die`` ``count`` times.
+
+        Args:
+            count: Number of dice to roll.
+            rng: Optional random number source. Any object with a
+                ``random() -> float`` method. When None, stdlib random is used.
+        """
+        # Tens and ones dice alternate in the draw order
+        digits = DiceRoller._draw(0, 9, 2 * count, rng)
+        die_pairs = [(tens * 10, ones) for tens, ones in zip(digits[::2], digits[1::2])]
+        totals = [(tens + ones) or 100 for tens, ones in die_pairs]
+
+        logger = get_debug_logger()
+        if logger.enabled:
+            for total, (tens, ones) in zip(totals, die_pairs):
+                logger.log("Rolling 1d%%: %s (tens: %s, ones: %s)", total, tens, ones)
+        return totals, die_pairs
+
+    @staticmethod
+    def _draw(low: int, high: int, count: int, rng=None) -> List[int]:
+        """Draw ``count`` integers in [low, high], resolving the source once.
+
+        Consumes the random source exactly like ``count`` calls to
+        ``_randint(rng, low, high)``.
+        """
+        span = high - low + 1
+        if rng is None:
+            randbelow = _stdlib_randbelow(span)
+            if randbelow is not None:
+                return [randbelow(span) + low for _ in range(count)]
+            randint = random.randint
+            return [randint(low, high) for _ in range(count)]
+        rand = rng.random
+        return [int(rand() * span) + low for _ in range(count)]
+
     @staticmethod
     def should_reroll(
         value: int,
@@ -1087,8 +1756,6 @@ class ExpressionProcessor:
     @staticmethod
     def normalize_unicode(expr: str) -> str:
         """Normalize unicode characters and symbols in the expression."""
-        from .expression_lexer import ExpressionLexer
-
         return ExpressionLexer.normalize_unicode_chars(expr)
 
     @staticmethod
@@ -1097,19 +1764,36 @@ class ExpressionProcessor:
         Process shorthand dice expressions and convert them to
         standard notation.
         """
-        expr_upper = expr.upper()
-
         # Check for special flux expressions first
-        if "GOODFLUX" in expr_upper:
-            return "GOODFLUX_SPECIAL"
-        elif "BADFLUX" in expr_upper:
-            return "BADFLUX_SPECIAL"
+        flux = _SPECIAL_FLUX_RE.search(expr)
+        if flux:
+            return f"{flux.group(0).upper()}_SPECIAL"
+
+        # Replace every shorthand in one pass, leaving the case of the rest
+        # of the expression alone
+        return _SHORTHAND_RE.sub(_expand_shorthand, expr)
 
-        # Replace standard shorthands with their expanded forms
-        for shorthand, expansion in SHORTHAND_EXPANSIONS.items():
-            if shorthand in expr_upper:
-                expr = expr_upper.replace(shorthand, expansion)
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def preprocess(expr: str) -> str:
+        """Normalize unicode characters and expand shorthands.
 
+        Both steps are deterministic, so the result is memoized on the input
+        string. Negative dice are not rewritten here, since the parser
+        selection looks at the expression before that step.
+        """
+        for step, _ in _PREPROCESS_STEPS:
+            expr = step(expr)
+        return expr
+
+    @staticmethod
+    def preprocess_logged(expr: str, logger: DebugLogger) -> str:
+        """Run the steps of ``preprocess`` without the cache, logging each
+        one."""
+        for step, log_step in _PREPROCESS_STEPS:
+            result = step(expr)
+            log_step(logger, expr, result)
+            expr = result
         return expr
 
     @staticmethod
@@ -1118,12 +1802,6 @@ class ExpressionProcessor:
         Process negative dice expressions and convert them to '0 - XdY'
         format.
         """
-        # Pattern to match negative dice expressions at start of string or
-        # after operators/parentheses
-        negative_dice_pattern = re.compile(
-            r"(^|[\+\-\*\/\(\s])\s*-(\d+d(?:\d+|F)[^\s\+\-\*\/\)]*)",
-            re.IGNORECASE,
-        )
 
         def replace_negative_dice(match):
             prefix = match.group(1)
@@ -1139,13 +1817,33 @@ class ExpressionProcessor:
             else:
                 return f"{prefix} 0 - {dice_expr}"
 
-        return negative_dice_pattern.sub(replace_negative_dice, expr)
+        return _NEGATIVE_DICE_RE.sub(replace_negative_dice, expr)
 
     @staticmethod
     def should_use_precedence_parsing(expr: str) -> bool:
         """Determine if expression needs precedence parsing."""
-        has_mult_div = any(op in expr for op in ["x", "*", "×", "/"])
-        has_add_sub_with_numbers = any(op in expr for op in ["+", "-"]) and any(
-            char.isdigit() for char in expr.replace("d", "")
-        )
-        return has_mult_div or has_add_sub_with_numbers
+        # Plain substring checks run in C; simple terms like "1d20" or
+        # "4d6kh3" are decided without a Python-level loop.
+        if "x" in expr or "*" in expr or "/" in expr or "×" in expr:
+            return True
+        if "+" not in expr and "-" not in expr:
+            return False
+        # Addition or subtraction only matters when numbers are involved
+        return any(char.isdigit() for char in expr)
+
+
+def _log_normalized(logger: DebugLogger, before: str, after: str) -> None:
+    logger.log("NORMALIZED: '%s'", after)
+
+
+def _log_shorthands(logger: DebugLogger, before: str, after: str) -> None:
+    if after != before:
+        logger.log("[SHORTHAND_EXPANSION] '%s' -> '%s'", before, after)
+
+
+# Steps of ExpressionProcessor.preprocess, in order, each with the debug
+# message logged for it when compiling in debug mode
+_PREPROCESS_STEPS = (
+    (ExpressionProcessor.normalize_unicode, _log_normalized),
+    (ExpressionProcessor.process_shorthands, _log_shorthands),
+)
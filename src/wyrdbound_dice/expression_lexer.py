@@ -1,4 +1,5 @@
-from typing import Optional
+import re
+from typing import List, Optional
 
 from .errors import ParseError
 from .expression_token import Token, TokenType
@@ -10,28 +11,24 @@ class UnicodeNormalizer:
     @staticmethod
     def normalize_unicode_chars(expression: str) -> str:
         """Normalize Unicode characters to ASCII equivalents."""
-        result = ""
-        for char in expression:
-            normalized_char = UnicodeNormalizer._normalize_single_char(char)
-            result += normalized_char
-        return result
-
-    @staticmethod
-    def _normalize_single_char(char: str) -> str:
-        """Normalize a single Unicode character."""
-        # Convert fullwidth digits (U+FF10 to U+FF19) to ASCII
-        if ord("０") <= ord(char) <= ord("９"):
-            return chr(ord(char) - ord("０") + ord("0"))
-
-        # Normalize unicode operators
-        unicode_mappings = {
-            "＋": "+",  # Fullwidth plus
-            "−": "-",  # Unicode minus (U+2212)
-            "×": "*",  # Unicode multiplication
-            "÷": "/",  # Unicode division
-        }
-
-        return unicode_mappings.get(char, char)
+        if expression.isascii():
+            # Nothing to map, and str.isascii is a single flag check
+            return expression
+        return expression.translate(_TRANSLATION_TABLE)
+
+
+# Unicode characters and their ASCII equivalents, applied in one
+# str.translate pass
+_TRANSLATION_TABLE = str.maketrans(
+    {
+        # Fullwidth digits (U+FF10 to U+FF19)
+        **{chr(ord("０") + offset): str(offset) for offset in range(10)},
+        "＋": "+",  # Fullwidth plus
+        "−": "-",  # Unicode minus (U+2212)
+        "×": "*",  # Unicode multiplication
+        "÷": "/",  # Unicode division
+    }
+)
 
 
 class DiceExpressionReader:
@@ -84,53 +81,31 @@ class DiceExpressionReader:
         Read optional dice-specific modifiers:
         keep (k), reroll (r), explode (e).
         """
-        while self.lexer.current_char is not None:
-            if self.lexer.current_char == "k":
-                self._read_keep_modifier()
-            elif self.lexer.current_char == "r":
-                self._read_reroll_modifier()
-            elif self.lexer.current_char == "e":
-                self._read_explode_modifier()
-            else:
+        lexer = self.lexer
+        while lexer.current_char is not None:
+            pattern = _MODIFIER_PATTERNS.get(lexer.current_char)
+            if pattern is None:
                 # Stop at any other character (including math operators)
                 break
+            match = pattern.match(lexer.expr, lexer.pos)
+            if match is None:
+                raise ParseError(f"Incomplete dice modifier at position {lexer.pos}")
+            lexer.advance_to(match.end())
 
-    def _read_keep_modifier(self) -> None:
-        """Read keep modifier: kh2, kl1, etc."""
-        self.lexer.advance()
-        if self.lexer.current_char in "hl":
-            self.lexer.advance()
-        while self.lexer.current_char is not None and self.lexer.current_char.isdigit():
-            self.lexer.advance()
 
-    def _read_reroll_modifier(self) -> None:
-        """Read reroll modifier: r>=3, r=1, etc."""
-        self.lexer.advance()
-        # Read optional count (number or 'o' for once)
-        while self.lexer.current_char is not None and (
-            self.lexer.current_char.isdigit() or self.lexer.current_char == "o"
-        ):
-            self.lexer.advance()
-        # Read comparison operator
-        if self.lexer.current_char in "=<>":
-            while self.lexer.current_char in "=<>":
-                self.lexer.advance()
-        # Read target number
-        while self.lexer.current_char is not None and self.lexer.current_char.isdigit():
-            self.lexer.advance()
+# Each dice modifier, matched in one call instead of a character at a time.
+# Keep and reroll need at least one more character after the letter and
+# after a reroll operator; the lookaheads after each run stop the engine
+# from backtracking into a shorter match when that character is missing.
+_KEEP_MODIFIER = r"k(?=.)[hl]?\d*"
+_REROLL_MODIFIER = r"r[\do]*(?![\do])[=<>]*(?![=<>])(?=.)\d*"
+_EXPLODE_MODIFIER = r"e[=<>]*\d*"
 
-    def _read_explode_modifier(self) -> None:
-        """Read exploding dice modifier: e>=8, e6, etc."""
-        self.lexer.advance()
-        # Read optional comparison operator
-        if self.lexer.current_char is not None and self.lexer.current_char in "=<>":
-            while (
-                self.lexer.current_char is not None and self.lexer.current_char in "=<>"
-            ):
-                self.lexer.advance()
-        # Read target number
-        while self.lexer.current_char is not None and self.lexer.current_char.isdigit():
-            self.lexer.advance()
+_MODIFIER_PATTERNS = {
+    "k": re.compile(_KEEP_MODIFIER, re.DOTALL),
+    "r": re.compile(_REROLL_MODIFIER, re.DOTALL),
+    "e": re.compile(_EXPLODE_MODIFIER),
+}
 
 
 class ExpressionLexer:
@@ -157,6 +132,11 @@ class ExpressionLexer:
         else:
             self.current_char = self.expr[self.pos]
 
+    def advance_to(self, pos: int) -> None:
+        """Move to the given position."""
+        self.pos = pos
+        self.current_char = self.expr[pos] if pos < len(self.expr) else None
+
     def peek(self, offset: int = 1) -> Optional[str]:
         """Look ahead at the next character without advancing."""
         peek_pos = self.pos + offset
@@ -176,6 +156,15 @@ class ExpressionLexer:
         """Read a complete dice expression using the DiceExpressionReader."""
         return self.dice_reader.read_dice_expression()
 
+    def tokenize(self) -> List[Token]:
+        """Read all remaining tokens, ending with the EOF token."""
+        tokens = []
+        while True:
+            token = self.get_next_token()
+            tokens.append(token)
+            if token.type == TokenType.EOF:
+                return tokens
+
     def get_next_token(self) -> Token:
         """Get the next token from the expression."""
         while self.current_char is not None:
@@ -238,3 +227,94 @@ class ExpressionLexer:
             return Token(TokenType.RPAREN, ")", pos)
 
         return None
+
+
+# Character classes for the ASCII fast path of tokenize()
+_OTHER = 0
+_DIGIT = 1
+_OPERATOR = 2
+
+_OPERATOR_TOKENS = {
+    "+": (TokenType.PLUS, "+"),
+    "-": (TokenType.MINUS, "-"),
+    "x": (TokenType.MULTIPLY, "x"),
+    "*": (TokenType.MULTIPLY, "x"),
+    "/": (TokenType.DIVIDE, "/"),
+    "(": (TokenType.LPAREN, "("),
+    ")": (TokenType.RPAREN, ")"),
+}
+
+_CHAR_CLASS = bytes(
+    (
+        _DIGIT
+        if chr(code).isdigit()
+        else _OPERATOR if chr(code) in _OPERATOR_TOKENS else _OTHER
+    )
+    for code in range(128)
+)
+
+
+def tokenize(expression: str) -> List[Token]:
+    """Tokenize an expression, ending with the EOF token.
+
+    The expression is normalized the same way ExpressionLexer does it, so
+    Unicode operators and fullwidth digits become plain ASCII, and then
+    scanned by index with a character class table. Anything the fast path
+    does not expect, such as other non-ASCII characters, stray characters
+    or truncated modifiers, is handed to ExpressionLexer, so tokens and
+    errors are always the same as lexing the expression with
+    ExpressionLexer directly.
+    """
+    expr = UnicodeNormalizer.normalize_unicode_chars(expression).replace(" ", "")
+    if not expr.isascii():
+        return ExpressionLexer(expression).tokenize()
+
+    tokens = []
+    n = len(expr)
+    i = 0
+    while i < n:
+        char = expr[i]
+        char_class = _CHAR_CLASS[ord(char)]
+
+        if char_class == _OPERATOR:
+            tokens.append(Token(*_OPERATOR_TOKENS[char], i))
+            i += 1
+        elif char_class == _DIGIT:
+            if i + 1 < n and expr[i + 1] == "d":
+                end = _scan_dice(expr, i + 2)
+                if end < 0:
+                    return ExpressionLexer(expression).tokenize()
+                tokens.append(Token(TokenType.DICE, expr[i:end], i))
+                i = end
+            else:
+                end = i + 1
+                while end < n and expr[end].isdigit():
+                    end += 1
+                number = int(expr[i:end])
+                tokens.append(Token(TokenType.NUMBER, number, end - len(str(number))))
+                i = end
+        else:
+            return ExpressionLexer(expression).tokenize()
+
+    tokens.append(Token(TokenType.EOF, None, n))
+    return tokens
+
+
+def _scan_dice(expr: str, i: int) -> int:
+    """Scan the sides and modifiers of a dice term starting after the 'd'.
+
+    Returns the end index of the term, or -1 when the term ends somewhere
+    DiceExpressionReader treats specially.
+    """
+    end = _DICE_BODY_RE.match(expr, i).end()
+    # The modifier chain only stops at a 'k' or 'r' that is incomplete
+    if end < len(expr) and expr[end] in "kr":
+        return -1
+    return end
+
+
+# Sides (a number or 'F' for fudge) followed by any chain of modifiers
+_DICE_BODY_RE = re.compile(
+    rf"(?:[fF]|[0-9]*)(?:{_KEEP_MODIFIER}|{_REROLL_MODIFIER}|{_EXPLODE_MODIFIER})*",
+    re.DOTALL,
+)
@@ -1,20 +1,43 @@
+import operator as _operator
 from dataclasses import dataclass
 from typing import List, Tuple
 
 from .errors import DivisionByZeroError, ParseError
-from .expression_token import Token, TokenType
+from .expression_token import EOF_TOKEN, Token, TokenType
 from .roll_result import RollResult
 
 
 @dataclass
 class EvaluationResult:
-    """Result of evaluating a parsed expression."""
+    """Result of evaluating a parsed expression.
+
+    One is created per node or program step on every roll, so the class
+    declares ``__slots__`` by hand (``dataclass(slots=True)`` needs Python
+    3.10). Fields have no defaults, which is what lets the two combine.
+    """
+
+    __slots__ = ("value", "description", "dice_results")
 
     value: int
     description: str
     dice_results: List["RollResult"]
 
 
+def _floor_divide(left_val: int, right_val: int) -> int:
+    if right_val == 0:
+        raise DivisionByZeroError()
+    return left_val // right_val  # Integer division
+
+
+# Function and display symbol for each binary operator
+BINARY_OPERATORS = {
+    TokenType.PLUS: (_operator.add, "+"),
+    TokenType.MINUS: (_operator.sub, "-"),
+    TokenType.MULTIPLY: (_operator.mul, "x"),
+    TokenType.DIVIDE: (_floor_divide, "/"),
+}
+
+
 class OperatorHandler:
     """Handles evaluation of different operators."""
 
@@ -23,18 +46,11 @@ class OperatorHandler:
         left_val: int, right_val: int, operator: TokenType
     ) -> Tuple[int, str]:
         """Evaluate a binary operation and return (result, symbol)."""
-        if operator == TokenType.PLUS:
-            return left_val + right_val, "+"
-        elif operator == TokenType.MINUS:
-            return left_val - right_val, "-"
-        elif operator == TokenType.MULTIPLY:
-            return left_val * right_val, "x"
-        elif operator == TokenType.DIVIDE:
-            if right_val == 0:
-                raise DivisionByZeroError()
-            return left_val // right_val, "/"  # Integer division
-        else:
-            raise ParseError(f"Unknown operator: {operator}")
+        try:
+            function, symbol = BINARY_OPERATORS[operator]
+        except KeyError:
+            raise ParseError(f"Unknown operator: {operator}") from None
+        return function(left_val, right_val), symbol
 
 
 class DescriptionBuilder:
@@ -119,13 +135,13 @@ class ExpressionParser:
     def __init__(self, tokens: List[Token]):
         self.tokens = tokens
         self.pos = 0
-        self.current_token = self.tokens[0] if tokens else Token(TokenType.EOF, None)
+        self.current_token = self.tokens[0] if tokens else EOF_TOKEN
 
     def advance(self) -> None:
         """Move to the next token."""
         self.pos += 1
         if self.pos >= len(self.tokens):
-            self.current_token = Token(TokenType.EOF, None)
+            self.current_token = EOF_TOKEN
         else:
             self.current_token = self.tokens[self.pos]
 
@@ -198,7 +214,13 @@ class ExpressionParser:
 
 # Expression tree node classes
 class ParsedExpression:
-    """Base class for parsed expression nodes."""
+    """Base class for parsed expression nodes.
+
+    Nodes are cached and shared between rolls, so they must not hold any
+    per-roll state.
+    """
+
+    __slots__ = ()
 
     def evaluate(self, dice_class) -> EvaluationResult:
         """Evaluate this expression node."""
@@ -208,6 +230,8 @@ class ParsedExpression:
 class NumberExpression(ParsedExpression):
     """A constant number in the expression."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: int):
         self.value = value
 
@@ -220,6 +244,8 @@ class NumberExpression(ParsedExpression):
 class DiceExpression(ParsedExpression):
     """A dice expression like '2d6' or '1d20kh1'."""
 
+    __slots__ = ("dice_expr",)
+
     def __init__(self, dice_expr: str):
         self.dice_expr = dice_expr
 
@@ -239,6 +265,8 @@ class BinaryOperation(ParsedExpression):
     or division.
     """
 
+    __slots__ = ("left", "operator", "right")
+
     def __init__(
         self,
         left: ParsedExpression,
@@ -252,19 +280,17 @@ class BinaryOperation(ParsedExpression):
     def evaluate(self, dice_class) -> EvaluationResult:
         left_result = self.left.evaluate(dice_class)
         right_result = self.right.evaluate(dice_class)
-
-        # Perform the operation
         value, op_symbol = OperatorHandler.evaluate_binary_operation(
             left_result.value, right_result.value, self.operator
         )
-
-        # Build description
         description = DescriptionBuilder.build_binary_description(
             left_result, right_result, self.operator, op_symbol
         )
 
-        # Combine dice results
-        dice_results = left_result.dice_results + right_result.dice_results
+        # Both operand results were created by this evaluation, so the left
+        # list is extended rather than copied into a new one at every node
+        dice_results = left_result.dice_results
+        dice_results += right_result.dice_results
 
         return EvaluationResult(
             value=value, description=description, dice_results=dice_results
@@ -274,6 +300,8 @@ class BinaryOperation(ParsedExpression):
 class UnaryOperation(ParsedExpression):
     """A unary operation like negation."""
 
+    __slots__ = ("operator", "operand")
+
     def __init__(self, operator: TokenType, operand: ParsedExpression):
         self.operator = operator
         self.operand = operand
@@ -0,0 +1,256 @@
+from array import array
+from typing import Callable, List, Optional, Tuple
+
+from .errors import DivisionByZeroError, ParseError
+from .expression_parser import (
+    BINARY_OPERATORS,
+    BinaryOperation,
+    DescriptionBuilder,
+    DiceExpression,
+    EvaluationResult,
+    NumberExpression,
+    ParsedExpression,
+    UnaryOperation,
+)
+from .expression_token import TokenType
+
+# Opcodes. Keep, drop, reroll and explode modifiers belong to a dice
+# expression string, so they are carried by OP_ROLL rather than having
+# opcodes of their own.
+OP_PUSH = 0
+OP_ROLL = 1
+OP_ADD = 2
+OP_SUB = 3
+OP_MUL = 4
+OP_DIV = 5
+OP_NEG = 6
+
+_BINARY_OPCODES = {
+    TokenType.PLUS: OP_ADD,
+    TokenType.MINUS: OP_SUB,
+    TokenType.MULTIPLY: OP_MUL,
+    TokenType.DIVIDE: OP_DIV,
+}
+
+
+class ExpressionProgram:
+    """A parsed expression flattened into postfix opcodes.
+
+    ``codes`` holds one opcode per step, as bytes so running the program
+    iterates them in C. ``OP_PUSH`` and ``OP_ROLL`` each
+    consume the next entry of ``consts`` (a number or a dice expression
+    string), in order. Like the expression tree it is built from, a program
+    holds no per-roll state and can be shared between rolls.
+
+    ``value_codes`` and ``value_consts`` are the same program with every
+    dice-free subexpression folded into one number. ``roll`` runs them; the
+    unfolded steps are kept for ``evaluate`` and ``describe``, since the
+    description shows each number and operator as written.
+    """
+
+    __slots__ = ("codes", "consts", "value_codes", "value_consts")
+
+    def __init__(
+        self,
+        codes: bytes,
+        consts: tuple,
+        value_codes: Optional[bytes] = None,
+        value_consts: Optional[tuple] = None,
+    ):
+        self.codes = codes
+        self.consts = consts
+        self.value_codes = codes if value_codes is None else value_codes
+        self.value_consts = consts if value_consts is None else value_consts
+
+    def evaluate(self, dice_class) -> EvaluationResult:
+        """Run the program and return the value left on the stack."""
+        stack: List[EvaluationResult] = []
+        next_const = iter(self.consts).__next__
+        for op in self.codes:
+            _HANDLERS[op](stack, next_const, dice_class)
+        return stack[0]
+
+    def roll(self, dice_class) -> Tuple[int, list]:
+        """Run the program for its value only.
+
+        Returns the value and the dice results in the order they were rolled,
+        which is all ``describe`` needs to build the description later.
+        """
+        stack: list = []
+        push = stack.append
+        pop = stack.pop
+        dice_results = []
+        next_const = iter(self.value_consts).__next__
+        roll_dice = dice_class._roll_single_dice_expression_from_string
+        # Branches are ordered by how often each opcode occurs: every operand
+        # is a roll or a number, and negation is rare
+        for op in self.value_codes:
+            if op == OP_ROLL:
+                result = roll_dice(next_const())
+                dice_results.append(result)
+                push(result.subtotal)
+            elif op == OP_PUSH:
+                push(next_const())
+            elif op == OP_NEG:
+                stack[-1] = -stack[-1]
+            else:
+                right = pop()
+                stack[-1] = _FUNCTIONS[op](stack[-1], right)
+        return stack[0], dice_results
+
+    def describe(self, dice_results: list) -> str:
+        """Describe a run of the program from the dice results it rolled."""
+        return self.evaluate(_ReplayedDice(dice_results)).description
+
+
+class _ReplayedDice:
+    """Dice class handle that hands back already rolled dice results, in
+    order, instead of rolling."""
+
+    __slots__ = ("_next_result",)
+
+    def __init__(self, dice_results: list):
+        self._next_result = iter(dice_results).__next__
+
+    def _roll_single_dice_expression_from_string(self, dice_expr: str):
+        return self._next_result()
+
+
+class ProgramCompiler:
+    """Flattens expression trees into ExpressionPrograms."""
+
+    @staticmethod
+    def compile(tree: ParsedExpression) -> ExpressionProgram:
+        """Compile an expression tree into postfix opcodes."""
+        codes = array("B")
+        consts: list = []
+        ProgramCompiler._emit(tree, codes, consts)
+        value_codes = array("B")
+        value_consts: list = []
+        ProgramCompiler._emit(tree, value_codes, value_consts, fold=True)
+        if value_codes == codes:
+            return ExpressionProgram(codes.tobytes(), tuple(consts))
+        return ExpressionProgram(
+            codes.tobytes(),
+            tuple(consts),
+            value_codes.tobytes(),
+            tuple(value_consts),
+        )
+
+    @staticmethod
+    def _emit(
+        node: ParsedExpression, codes: array, consts: list, fold: bool = False
+    ) -> None:
+        if fold and not isinstance(node, NumberExpression):
+            value = ProgramCompiler._constant_value(node)
+            if value is not None:
+                codes.append(OP_PUSH)
+                consts.append(value)
+                return
+        if isinstance(node, NumberExpression):
+            codes.append(OP_PUSH)
+            consts.append(node.value)
+        elif isinstance(node, DiceExpression):
+            codes.append(OP_ROLL)
+            consts.append(node.dice_expr)
+        elif isinstance(node, BinaryOperation):
+            if node.operator not in _BINARY_OPCODES:
+                raise ParseError(f"Unknown operator: {node.operator}")
+            ProgramCompiler._emit(node.left, codes, consts, fold)
+            ProgramCompiler._emit(node.right, codes, consts, fold)
+            codes.append(_BINARY_OPCODES[node.operator])
+        elif isinstance(node, UnaryOperation):
+            if node.operator != TokenType.MINUS:
+                raise ParseError(f"Unknown unary operator: {node.operator}")
+            ProgramCompiler._emit(node.operand, codes, consts, fold)
+            codes.append(OP_NEG)
+        else:
+            raise ParseError(f"Cannot compile expression node: {node!r}")
+
+    @staticmethod
+    def _constant_value(node: ParsedExpression) -> Optional[int]:
+        """The value of a subexpression without dice, or None.
+
+        Subexpressions that divide by zero are left unfolded, so the error is
+        still raised when the program runs, after any dice before it roll.
+        """
+        if isinstance(node, NumberExpression):
+            return node.value
+        if isinstance(node, BinaryOperation) and node.operator in BINARY_OPERATORS:
+            left = ProgramCompiler._constant_value(node.left)
+            if left is None:
+                return None
+            right = ProgramCompiler._constant_value(node.right)
+            if right is None:
+                return None
+            try:
+                return BINARY_OPERATORS[node.operator][0](left, right)
+            except DivisionByZeroError:
+                return None
+        if isinstance(node, UnaryOperation) and node.operator == TokenType.MINUS:
+            value = ProgramCompiler._constant_value(node.operand)
+            return None if value is None else -value
+        return None
+
+
+def _push(stack: list, next_const: Callable, dice_class) -> None:
+    value = next_const()
+    stack.append(EvaluationResult(value=value, description=str(value), dice_results=[]))
+
+
+def _roll(stack: list, next_const: Callable, dice_class) -> None:
+    result = dice_class._roll_single_dice_expression_from_string(next_const())
+    stack.append(
+        EvaluationResult(
+            value=result.subtotal, description=str(result), dice_results=[result]
+        )
+    )
+
+
+def _binary(operator: TokenType) -> Callable:
+    # Resolved once here, so running an operator needs no dispatch on its
+    # token type
+    function, op_symbol = BINARY_OPERATORS[operator]
+    describe = DescriptionBuilder.build_binary_description
+
+    def handler(stack: list, next_const: Callable, dice_class) -> None:
+        # Every stack entry is created by this run of the program, so the
+        # left operand is updated in place and its dice_results grows into
+        # the final list instead of being copied at every operator.
+        right = stack.pop()
+        left = stack[-1]
+        value = function(left.value, right.value)
+        left.description = describe(left, right, operator, op_symbol)
+        left.dice_results += right.dice_results
+        left.value = value
+
+    return handler
+
+
+def _neg(stack: list, next_const: Callable, dice_class) -> None:
+    operand = stack[-1]
+    operand.value = -operand.value
+    operand.description = f"-{operand.description}"
+
+
+# Arithmetic of each binary opcode, for value-only runs
+_FUNCTIONS = (None, None) + tuple(
+    BINARY_OPERATORS[operator][0]
+    for operator in (
+        TokenType.PLUS,
+        TokenType.MINUS,
+        TokenType.MULTIPLY,
+        TokenType.DIVIDE,
+    )
+)
+
+# Dispatch table indexed by opcode
+_HANDLERS = (
+    _push,
+    _roll,
+    _binary(TokenType.PLUS),
+    _binary(TokenType.MINUS),
+    _binary(TokenType.MULTIPLY),
+    _binary(TokenType.DIVIDE),
+    _neg,
+)
@@ -1,4 +1,3 @@
-from dataclasses import dataclass
 from enum import Enum
 from typing import Union
 
@@ -16,34 +15,77 @@ class TokenType(Enum):
     RPAREN = "RPAREN"
     EOF = "EOF"
 
+    # Members are singletons compared by identity, so they can hash by
+    # identity too. Enum's own __hash__ hashes the member name in Python.
+    __hash__ = object.__hash__
+
     def __str__(self) -> str:
         """Return a human-readable string representation."""
         return self.value
 
 
-@dataclass(frozen=True)
+_OPERATOR_TYPES = frozenset(
+    {TokenType.PLUS, TokenType.MINUS, TokenType.MULTIPLY, TokenType.DIVIDE}
+)
+_OPERAND_TYPES = frozenset({TokenType.DICE, TokenType.NUMBER})
+
+
 class Token:
-    """A token in a mathematical expression."""
+    """A token in a mathematical expression.
+
+    Tokens are treated as immutable values: equal when type, value and
+    position match, and hashable. The class is written by hand with
+    ``__slots__`` rather than as a frozen dataclass, whose generated
+    ``__init__`` sets each field through ``object.__setattr__`` and made
+    creating a token the main cost of tokenizing.
+    """
+
+    __slots__ = ("type", "value", "position")
 
-    type: TokenType
-    value: Union[str, int, None]
-    position: int = 0
+    def __init__(
+        self, type: TokenType, value: Union[str, int, None], position: int = 0
+    ):
+        self.type = type
+        self.value = value
+        self.position = position
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not Token:
+            return NotImplemented
+        return (
+            self.type is other.type
+            and self.value == other.value
+            and self.position == other.position
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.type, self.value, self.position))
+
+    def __repr__(self) -> str:
+        return (
+            f"Token(type={self.type!r}, value={self.value!r}, "
+            f"position={self.position!r})"
+        )
 
     def __str__(self) -> str:
         """Return a human-readable string representation."""
+        # The enum value is read directly, skipping a call to
+        # TokenType.__str__ for every token in the debug log
+        type_name = self.type.value
         if self.value is None:
-            return f"{self.type}@{self.position}"
-        return f"{self.type}({self.value})@{self.position}"
+            return f"{type_name}@{self.position}"
+        return f"{type_name}({self.value})@{self.position}"
 
     def is_operator(self) -> bool:
         """Check if this token represents an operator."""
-        return self.type in {
-            TokenType.PLUS,
-            TokenType.MINUS,
-            TokenType.MULTIPLY,
-            TokenType.DIVIDE,
-        }
+        return self.type in _OPERATOR_TYPES
 
     def is_operand(self) -> bool:
         """Check if this token represents an operand."""
-        return self.type in {TokenType.DICE, TokenType.NUMBER}
+        return self.type in _OPERAND_TYPES
+
+
+# Shared end-of-input token with no position, used when the parser runs
+# past its token list; it is never modified, so one instance serves every
+# parser
+EOF_TOKEN = Token(TokenType.EOF, None)
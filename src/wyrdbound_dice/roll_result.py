@@ -1,7 +1,31 @@
-from typing import List, Optional, Tuple
+from array import array
+from typing import List, Optional, Sequence, Tuple, Union
 
 from .errors import DivisionByZeroError
 
+# Smallest-first typecodes used to pack die faces; values that don't fit any
+# of them (huge static numbers) stay in a plain list.
+_ROLL_TYPECODES = ("b", "h", "i", "q")
+
+PackedRolls = Union[array, List[int]]
+
+
+def _pack_rolls(values: Sequence[int]) -> PackedRolls:
+    """Store die faces in the most compact array typecode that fits them."""
+    if not values:
+        return array("b")
+    try:
+        low = min(values)
+        high = max(values)
+        for typecode in _ROLL_TYPECODES:
+            limit = 1 << (8 * array(typecode).itemsize - 1)
+            if -limit <= low and high < limit:
+                return array(typecode, values)
+    except TypeError:
+        # Not plain integers; store them unchanged
+        pass
+    return list(values)
+
 
 class KeepOperationProcessor:
     """Handles keep operation logic for dice rolls."""
@@ -32,8 +56,9 @@ class KeepOperationProcessor:
                     current_rolls, keep_n
                 )
 
+            # Slices of a sorted list stay sorted, so the next operation
+            # can use current_rolls as is
             dropped.extend(newly_dropped)
-            current_rolls = sorted(current_rolls)
 
         return current_rolls, dropped
 
@@ -57,6 +82,30 @@ class KeepOperationProcessor:
         to_drop = rolls[keep_n:]
         return to_keep, to_drop
 
+    @staticmethod
+    def kept_sums(
+        faces: Sequence[int],
+        count: int,
+        num: int,
+        keep_type: Optional[str],
+        keep_n: Optional[int],
+    ) -> List[int]:
+        """Sum the kept dice of ``count`` rolls of ``num`` dice each.
+
+        ``faces`` holds the rolls back to back. Each sum is the subtotal a
+        RollResult with at most one keep operation would have, computed
+        without building the results, for bulk rolling.
+        """
+        if num == 0 or keep_n == 0:
+            return [0] * count
+        rows = zip(*[iter(faces)] * num)
+        if keep_type is None or keep_n >= num:
+            return list(map(sum, rows))
+        if keep_type == "h":
+            cut = num - keep_n
+            return [sum(sorted(row)[cut:]) for row in rows]
+        return [sum(sorted(row)[:keep_n]) for row in rows]
+
     @staticmethod
     def apply_legacy_keep(
         rolls: List[int], keep_type: str, keep_n: int
@@ -95,8 +144,9 @@ class KeepOperationProcessor:
                     current_rolls, drop_n
                 )
 
+            # Slices of a sorted list stay sorted, so the next operation
+            # can use current_rolls as is
             dropped.extend(newly_dropped)
-            current_rolls = sorted(current_rolls)
 
         return current_rolls, dropped
 
@@ -139,6 +189,30 @@ class FudgeDiceFormatter:
 
 
 class RollResult:
+    __slots__ = (
+        "num",
+        "sides",
+        "_rolls",
+        "all_rolls",
+        "_kept",
+        "_dropped",
+        "multiply",
+        "divide",
+        "is_fudge",
+        "is_percentile",
+        "keep_type",
+        "keep_n",
+        "keep_operations",
+        "drop_operations",
+        "reroll_count",
+        "reroll_cmp",
+        "reroll_target",
+        "explode_target",
+        "explode_cmp",
+        "_cross_dice_op",
+        "_cross_dice_result",
+    )
+
     def __init__(
         self,
         num: int,
@@ -162,7 +236,7 @@ class RollResult:
         # Basic attributes
         self.num = num
         self.sides = sides
-        self.rolls = rolls
+        self._rolls = rolls
         self.all_rolls = all_rolls or rolls
         self.multiply = multiply or 1
         self.divide = divide or 1
@@ -188,55 +262,96 @@ class RollResult:
         self._cross_dice_op = None
         self._cross_dice_result = None
 
-        # Calculate kept and dropped dice
-        self._calculate_kept_and_dropped()
+        # Keep and drop operations run on first use of the kept or dropped
+        # dice, so results that are only inspected for their faces never
+        # sort them
+        self._kept = None
+        self._dropped = None
+
+    @property
+    def rolls(self) -> List[int]:
+        return self._rolls
+
+    @rolls.setter
+    def rolls(self, values: List[int]) -> None:
+        # Kept and dropped describe the rolls the result was built with, so
+        # settle them before the faces change
+        if self._kept is None or self._dropped is None:
+            self._calculate_kept_and_dropped()
+        self._rolls = values
+
+    @property
+    def rolls_raw(self) -> PackedRolls:
+        """The die faces packed into the most compact array that fits them
+        (see _pack_rolls), for storing many results."""
+        return _pack_rolls(self._rolls)
+
+    @property
+    def kept(self) -> List[int]:
+        return self._kept_rolls()
+
+    @kept.setter
+    def kept(self, values: List[int]) -> None:
+        self._kept = values
+
+    @property
+    def dropped(self) -> List[int]:
+        return self._dropped_rolls()
+
+    @dropped.setter
+    def dropped(self, values: List[int]) -> None:
+        self._dropped = values
 
     @property
     def subtotal(self) -> int:
-        return sum(self.kept)
+        return sum(self._kept_rolls())
+
+    def _kept_rolls(self) -> List[int]:
+        """The kept dice, applying keep/drop operations if needed."""
+        kept = self._kept
+        if kept is None:
+            self._calculate_kept_and_dropped()
+            kept = self._kept
+        return kept
+
+    def _dropped_rolls(self) -> List[int]:
+        """The dropped dice, applying keep/drop operations if needed."""
+        dropped = self._dropped
+        if dropped is None:
+            self._calculate_kept_and_dropped()
+            dropped = self._dropped
+        return dropped
 
     def __str__(self):
         """Return a formatted string representation of the roll result."""
-        # Build modifier strings
-        keep_str = self._build_keep_string()
-        drop_str = self._build_drop_string()
-        reroll_str = self._build_reroll_string()
-        explode_str = self._build_explode_string()
+        # Dice notation with its modifiers, e.g. "4d6kh3r1<=2e6", built in
+        # one piece and shared by every format below
+        notation = (
+            f"{self.num}d{self.sides}{self._build_keep_string()}"
+            f"{self._build_drop_string()}{self._build_reroll_string()}"
+            f"{self._build_explode_string()}"
+        )
 
         # Format rolls display
         rolls_str = self._format_rolls_display()
 
-        # Calculate total with math operations
-        kept_sum = sum(self.kept)
+        kept_sum = sum(self._kept_rolls())
         if self.divide == 0:
             raise DivisionByZeroError()
-        total_with_math = (kept_sum * self.multiply) // self.divide
 
-        # Handle cross-dice operations
-        cross_dice_str = self._build_cross_dice_string(
-            kept_sum, keep_str, drop_str, reroll_str, explode_str, rolls_str
-        )
-        if cross_dice_str:
-            return cross_dice_str
-
-        # Handle multiplication/division for static values
-        math_operation_str = self._build_math_operation_string(
-            kept_sum, keep_str, drop_str, reroll_str, explode_str, rolls_str
-        )
-        if math_operation_str:
-            return math_operation_str
+        # Cross-dice operations, then multiplication/division by static values
+        if self._cross_dice_op or self.multiply != 1 or self.divide != 1:
+            operation_str = self._build_cross_dice_string(
+                kept_sum, notation, rolls_str
+            ) or self._build_math_operation_string(kept_sum, notation, rolls_str)
+            if operation_str:
+                return operation_str
 
         # Default format
+        total_with_math = (kept_sum * self.multiply) // self.divide
         if rolls_str:
-            return (
-                f"{total_with_math} ({self.num}d{self.sides}{keep_str}"
-                + f"{drop_str}{reroll_str}{explode_str}: {rolls_str})"
-            )
-        else:
-            return (
-                f"{total_with_math} ({self.num}d{self.sides}{keep_str}"
-                + f"{drop_str}{reroll_str}{explode_str})"
-            )
+            return f"{total_with_math} ({notation}: {rolls_str})"
+        return f"{total_with_math} ({notation})"
 
     def _build_keep_string(self) -> str:
         """Build the keep operations string for display."""
@@ -276,7 +391,15 @@ class RollResult:
             fudge_values = FudgeDiceFormatter.format_fudge_values(self.all_rolls)
             return ", ".join(fudge_values)
         elif self.is_percentile:
-            # Format percentile dice as [tens, ones]
+            # Format percentile dice as [tens, ones]. The roller always
+            # stores (tens, ones) pairs of ints, and ":02d" leaves values of
+            # 100 and up unpadded, so one format covers every pair.
+            try:
+                return ", ".join(
+                    [f"[{tens:02d}, {ones}]" for tens, ones in self.all_rolls]
+                )
+            except (TypeError, ValueError):
+                pass
             percentile_values = []
             for roll in self.all_rolls:
                 if isinstance(roll, tuple) and len(roll) == 2:
@@ -290,88 +413,73 @@ class RollResult:
                     percentile_values.append(str(roll))
             return ", ".join(percentile_values)
         else:
-            return ", ".join(str(r) for r in self.all_rolls)
+            return ", ".join(map(str, self.all_rolls))
 
     def _build_cross_dice_string(
-        self,
-        kept_sum: int,
-        keep_str: str,
-        drop_str: str,
-        reroll_str: str,
-        explode_str: str,
-        rolls_str: str,
+        self, kept_sum: int, notation: str, rolls_str: str
     ) -> Optional[str]:
         """Build string for cross-dice operations."""
         if not (self._cross_dice_op and self._cross_dice_result):
             return None
 
-        cross_dice_rolls = ", ".join(str(r) for r in self._cross_dice_result.all_rolls)
+        cross_dice_rolls = ", ".join(map(str, self._cross_dice_result.all_rolls))
         cross_dice_total = self._cross_dice_result.subtotal
-        dice_part = (
-            f"{self.num}d{self.sides}{keep_str}{drop_str}"
-            + f"{reroll_str}{explode_str}: {rolls_str}"
-        )
         cross_part = (
             f"{self._cross_dice_result.num}d"
-            + f"{self._cross_dice_result.sides}: {cross_dice_rolls}"
+            f"{self._cross_dice_result.sides}: {cross_dice_rolls}"
         )
 
         if self._cross_dice_op == "multiply":
-            return f"{kept_sum} ({dice_part}) x {cross_dice_total} ({cross_part})"
+            symbol = "x"
         elif self._cross_dice_op == "divide":
-            return f"{kept_sum} ({dice_part}) / {cross_dice_total} ({cross_part})"
-
-        return None
+            symbol = "/"
+        else:
+            return None
+        return (
+            f"{kept_sum} ({notation}: {rolls_str}) {symbol} "
+            f"{cross_dice_total} ({cross_part})"
+        )
 
     def _build_math_operation_string(
-        self,
-        kept_sum: int,
-        keep_str: str,
-        drop_str: str,
-        reroll_str: str,
-        explode_str: str,
-        rolls_str: str,
+        self, kept_sum: int, notation: str, rolls_str: str
     ) -> Optional[str]:
         """Build string for math operations with static values."""
         if self.multiply > 1:
-            dice_part = (
-                f"{self.num}d{self.sides}{keep_str}{drop_str}"
-                + f"{reroll_str}{explode_str}: {rolls_str}"
-            )
-            return f"{kept_sum} ({dice_part}) x {self.multiply}"
+            return f"{kept_sum} ({notation}: {rolls_str}) x {self.multiply}"
         elif self.divide > 1:
-            dice_part = (
-                f"{self.num}d{self.sides}{keep_str}{drop_str}"
-                + f"{reroll_str}{explode_str}: {rolls_str}"
-            )
-            return f"{kept_sum} ({dice_part}) / {self.divide}"
+            return f"{kept_sum} ({notation}: {rolls_str}) / {self.divide}"
 
         return None
 
     def _calculate_kept_and_dropped(self) -> None:
         """
         Calculate which dice are kept and which are dropped based
-        on keep/drop operations.
+        on keep/drop operations. Either side assigned explicitly in the
+        meantime is left as it is.
         """
         if self.drop_operations:
             # Apply drop operations
-            self.kept, self.dropped = KeepOperationProcessor.apply_drop_operations(
-                self.rolls, self.drop_operations
+            kept, dropped = KeepOperationProcessor.apply_drop_operations(
+                self._rolls, self.drop_operations
             )
         elif self.keep_operations:
             # Apply keep operations
-            self.kept, self.dropped = KeepOperationProcessor.apply_keep_operations(
-                self.rolls, self.keep_operations
+            kept, dropped = KeepOperationProcessor.apply_keep_operations(
+                self._rolls, self.keep_operations
             )
         elif self.keep_type and self.keep_n is not None:
             # Apply legacy keep operations
-            self.kept, self.dropped = KeepOperationProcessor.apply_legacy_keep(
-                self.rolls, self.keep_type, self.keep_n
+            kept, dropped = KeepOperationProcessor.apply_legacy_keep(
+                self._rolls, self.keep_type, self.keep_n
             )
         else:
             # No operations - keep all dice
-            self.kept = self.rolls
-            self.dropped = []
+            kept, dropped = self._rolls, []
+
+        if self._kept is None:
+            self._kept = kept
+        if self._dropped is None:
+            self._dropped = dropped
 
     def _build_drop_string(self) -> str:
         """Build the drop operations string for display."""
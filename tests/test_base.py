@@ -1,11 +1,6 @@
-import sys
 import unittest
-from pathlib import Path
 from unittest import mock
 
-# Add the src directory to the path so we can import wyrdbound_dice
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 
 class TestDiceBase(unittest.TestCase):
     """Base test class for dice tests with common setup and utilities."""
@@ -1,5 +1,12 @@
 """Test the convenience roll function that was added to fix the CI issue."""
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
 from wyrdbound_dice import Dice, StringLogger, roll
 
 
@@ -50,3 +57,28 @@ def test_ci_specific_test_case():
     print(f"Test roll result: {result.total}")
     assert 5 <= result.total <= 15
     print("✓ Basic functionality test passed")
+
+
+def test_package_import_is_lazy():
+    """Importing the package alone must not load the parser and evaluator."""
+    src = Path(__file__).parent.parent / "src"
+    code = (
+        "import sys\n"
+        "import wyrdbound_dice\n"
+        "assert 'wyrdbound_dice.dice' not in sys.modules\n"
+        "from wyrdbound_dice import StringLogger, ParseError\n"
+        "assert 'wyrdbound_dice.dice' not in sys.modules\n"
+        "from wyrdbound_dice import Dice\n"
+        "assert 'wyrdbound_dice.dice' in sys.modules\n"
+        "assert wyrdbound_dice.Dice is Dice\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(src))
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+def test_unknown_attribute_raises_attribute_error():
+    """Lazy lookup must keep normal AttributeError behaviour."""
+    import wyrdbound_dice
+
+    with pytest.raises(AttributeError):
+        wyrdbound_dice.NotARealName
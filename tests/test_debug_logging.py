@@ -1,15 +1,17 @@
 import logging
-import sys
+import random
 import unittest
 from io import StringIO
-from pathlib import Path
 from unittest import mock
 
-# Add the src directory to the path so we can import wyrdbound_dice
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from wyrdbound_dice import Dice
-from wyrdbound_dice.debug_logger import StringLogger
+from wyrdbound_dice.debug_logger import (
+    DebugLogger,
+    StringLogger,
+    configure_debug_logger,
+    get_debug_logger,
+    set_debug_mode,
+)
 
 
 class TestDebugLogging(unittest.TestCase):
@@ -222,6 +224,14 @@ class TestDebugLogging(unittest.TestCase):
         debug_output = string_logger.get_logs()
         self.assertEqual(len(debug_output), 0)
 
+    def test_string_logger_keeps_most_recent_messages(self):
+        """Test that StringLogger drops the oldest messages past its limit."""
+        string_logger = StringLogger(max_messages=2)
+        string_logger.debug("first")
+        string_logger.info("second")
+        string_logger.warning("third")
+        self.assertEqual(string_logger.get_logs(), "second\nthird")
+
     def test_python_logger_injection(self):
         """Test injecting a standard Python logger."""
         self.mock_randint.side_effect = [6]
@@ -248,6 +258,126 @@ class TestDebugLogging(unittest.TestCase):
         self.assertIn("DEBUG:", output)
         self.assertIn("Rolling expression", output)
 
+    def test_debug_roll_matches_plain_roll(self):
+        """Test that debug mode compiles expressions the same way."""
+        for expr in ("fudge + 1", "２d６ × 3", "-1d6 + 1d8", "1d20 - 1d4", "goodflux"):
+            with self.subTest(expr=expr):
+                plain = Dice.roll(expr, rng=random.Random(3))
+                logged = Dice.roll(
+                    expr, debug=True, logger=StringLogger(), rng=random.Random(3)
+                )
+                self.assertEqual(str(logged), str(plain))
+
+    def test_debug_mode_reset_after_roll(self):
+        """Test that the global debug logger is disabled again after a roll."""
+        self.mock_randint.side_effect = [4]
+        Dice.roll("1d6", debug=True, logger=StringLogger())
+        self.assertFalse(get_debug_logger().enabled)
+
+    def test_debug_mode_reset_after_failed_roll(self):
+        """Test that debug mode is switched off even when the roll raises."""
+        with self.assertRaises(Exception):
+            Dice.roll("invalid_expression", debug=True, logger=StringLogger())
+        self.assertFalse(get_debug_logger().enabled)
+
+    def test_plain_roll_leaves_installed_logger(self):
+        """Test that a roll without debug options keeps the current logger."""
+        logger = StringLogger()
+        set_debug_mode(True, logger)
+        self.addCleanup(set_debug_mode, False)
+        installed = get_debug_logger()
+        self.mock_randint.side_effect = [4, 2, 3]
+        Dice.roll("1d6")
+        Dice.roll("1d6 + 1d4")
+        self.assertIs(get_debug_logger(), installed)
+        self.assertIn("1d6", logger.get_logs())
+
+    def test_debug_mode_is_per_thread(self):
+        """Test that enabling debug mode in one thread doesn't affect others."""
+        import threading
+
+        set_debug_mode(True, StringLogger())
+        self.addCleanup(set_debug_mode, False)
+
+        seen = []
+        thread = threading.Thread(
+            target=lambda: seen.append(get_debug_logger().enabled)
+        )
+        thread.start()
+        thread.join()
+
+        self.assertTrue(get_debug_logger().enabled)
+        self.assertEqual(seen, [False])
+
+    def test_python_logger_above_debug_level_is_skipped(self):
+        """Test that a standard logger not accepting DEBUG disables logging."""
+        self.mock_randint.side_effect = [6]
+
+        logger = logging.getLogger("test_logger_info_level")
+        logger.setLevel(logging.INFO)
+        logger.handlers.clear()
+        string_stream = StringIO()
+        logger.addHandler(logging.StreamHandler(string_stream))
+
+        self.assertFalse(DebugLogger(True, logger).enabled)
+
+        result = Dice.roll("1d6", debug=True, logger=logger)
+        self.assertEqual(result.total, 6)
+        self.assertEqual(string_stream.getvalue(), "")
+
+    def test_swapping_in_a_warning_level_logger_disables_logging(self):
+        """Test that set_logger rechecks whether DEBUG records are wanted."""
+        logger = logging.getLogger("test_logger_warning_level")
+        logger.setLevel(logging.WARNING)
+
+        debug_logger = DebugLogger(True, StringLogger())
+        self.assertTrue(debug_logger.enabled)
+        debug_logger.set_logger(logger)
+        self.assertFalse(debug_logger.enabled)
+        debug_logger.set_logger(StringLogger())
+        self.assertTrue(debug_logger.enabled)
+
+        set_debug_mode(True, StringLogger())
+        self.addCleanup(set_debug_mode, False)
+        configure_debug_logger(logger)
+        self.assertFalse(get_debug_logger().enabled)
+
+    def test_python_logger_formats_lazily(self):
+        """Test that standard loggers receive %-style arguments, not strings."""
+        self.mock_randint.side_effect = [4]
+
+        logger = logging.getLogger("test_logger_lazy_format")
+        with self.assertLogs(logger, level="DEBUG") as captured:
+            Dice.roll("1d6", debug=True, logger=logger)
+
+        roll_records = [r for r in captured.records if "Rolling 1d%s" in r.msg]
+        self.assertEqual(len(roll_records), 1)
+        self.assertEqual(roll_records[0].args, (6, 4))
+        self.assertEqual(roll_records[0].getMessage(), "DEBUG: Rolling 1d6: 4")
+
+    def test_tokens_are_logged_as_a_joined_list(self):
+        """Test that tokens are logged without quoting each one."""
+        self.mock_randint.side_effect = [3, 4]
+        string_logger = StringLogger()
+
+        Dice.roll("2d6 + 3", debug=True, logger=string_logger)
+
+        self.assertIn(
+            "DEBUG: Tokens: [DICE(2d6)@0, PLUS(+)@3, NUMBER(3)@4]",
+            string_logger.get_logs(),
+        )
+
+    def test_percent_signs_in_arguments_are_not_interpolated(self):
+        """Test that expressions containing '%' are logged verbatim."""
+        self.mock_randint.side_effect = [4, 2]
+        string_logger = StringLogger()
+
+        Dice.roll("1d%", debug=True, logger=string_logger)
+
+        logs = string_logger.get_logs()
+        self.assertIn("DEBUG: NORMALIZED: '1d%'", logs)
+        self.assertIn("DEBUG: Rolling 1d%: ", logs)
+
     def test_custom_logger_protocol(self):
         """Test using a custom logger that implements the logging interface."""
         self.mock_randint.side_effect = [6]
@@ -1,12 +1,11 @@
-import sys
-from pathlib import Path
-
-# Add the src directory to the path so we can import wyrdbound_dice
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import random
+from array import array
 
 from test_base import TestDiceBase
 
-from wyrdbound_dice import Dice
+from wyrdbound_dice import Dice, ParseError, StringLogger
+from wyrdbound_dice.dice import ExpressionProcessor
+from wyrdbound_dice.roll_result import RollResult
 
 
 class TestDice(TestDiceBase):
@@ -20,6 +19,16 @@ class TestDice(TestDiceBase):
         r = Dice.roll("3d6")
         self.assertTotalAndDescription(r, 10, "10 = 10 (3d6: 2, 3, 5)")
 
+    def test_non_string_expression_raises_type_error(self):
+        for expr in (None, 5, b"1d6"):
+            with self.subTest(expr=expr):
+                with self.assertRaises(TypeError):
+                    Dice.roll(expr)
+                with self.assertRaises(TypeError):
+                    Dice.roll(expr, debug=True, logger=StringLogger())
+                with self.assertRaises(TypeError):
+                    Dice.roll_many(expr, 2)
+
 
 class TestDiceMultipleRolls(TestDiceBase):
     def test_roll_sum_two_different_dice(self):
@@ -124,3 +133,196 @@ class TestDiceDivision(TestDiceBase):
         self.mock_randint.side_effect = [7, 3, 9, 2]
         r = Dice.roll("3d10 ÷ 1d4")
         self.assertTotalAndDescription(r, 9, "9 = 19 (3d10: 7, 3, 9) / 2 (1d4: 2)")
+
+
+class TestDiceParseCache(TestDiceBase):
+    def setUp(self):
+        super().setUp()
+        Dice.clear_parse_cache()
+
+    def test_repeated_expression_is_parsed_once(self):
+        self.mock_randint.side_effect = [3, 4, 5, 6]
+        r1 = Dice.roll("1d6 + 2")
+        r2 = Dice.roll("1d6 + 2")
+        self.assertTotalAndDescription(r1, 5, "5 = 3 (1d6: 3) + 2")
+        self.assertTotalAndDescription(r2, 6, "6 = 4 (1d6: 4) + 2")
+        info = Dice.parse_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+    def test_cached_original_method_rolls_fresh_dice(self):
+        self.mock_randint.side_effect = [1, 2, 5, 6]
+        r1 = Dice.roll("2d6")
+        r2 = Dice.roll("2d6")
+        self.assertTotalAndDescription(r1, 3, "3 = 3 (2d6: 1, 2)")
+        self.assertTotalAndDescription(r2, 11, "11 = 11 (2d6: 5, 6)")
+
+    def test_cached_rolls_match_uncached_rolls(self):
+        """Cached parses, fast paths and debug-mode parses agree."""
+        exprs = (
+            "2d6",
+            " 1d20 ",
+            "4dF",
+            "3df",
+            "1d%",
+            "4d6kh3",
+            "1d6e",
+            "1d%r<10",
+            "FUDGE",
+            "2d6 + 1",
+            "1d6 x 2 + 1d4",
+            "２d６＋３",
+        )
+        for expr in exprs:
+            with self.subTest(expr=expr):
+                rng = random.Random(11)
+                cached = [str(Dice.roll(expr, rng=rng)) for _ in range(3)]
+                rng = random.Random(11)
+                uncached = [
+                    str(Dice.roll(expr, debug=True, logger=StringLogger(), rng=rng))
+                    for _ in range(3)
+                ]
+                self.assertEqual(cached, uncached)
+
+    def test_preprocess(self):
+        self.assertEqual(ExpressionProcessor.preprocess("fudge"), "4dF")
+        self.assertEqual(ExpressionProcessor.preprocess("２d６＋３"), "2d6+3")
+        self.assertEqual(ExpressionProcessor.preprocess("fudge"), "4dF")
+
+    def test_clear_parse_cache(self):
+        self.mock_randint.side_effect = [3, 4, 5]
+        Dice.roll("1d6 + 2")
+        Dice.roll("2d6")
+        self.assertGreater(Dice.parse_cache_info().currsize, 0)
+        Dice.clear_parse_cache()
+        self.assertEqual(Dice.parse_cache_info().currsize, 0)
+
+    def test_debug_mode_bypasses_cache(self):
+        self.mock_randint.side_effect = [4]
+        Dice.roll("1d6", debug=True, logger=StringLogger())
+        self.assertEqual(Dice.parse_cache_info().currsize, 0)
+
+    def test_invalid_expression_is_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(ParseError):
+                Dice.roll("1d")
+        self.assertEqual(Dice.parse_cache_info().currsize, 0)
+
+
+class TestRollResultStorage(TestDiceBase):
+    def test_rolls_are_lists_and_pack_on_request(self):
+        self.mock_randint.side_effect = [1, 6, 3, 5]
+        result = Dice.roll("4d6kh3").results[0]
+        self.assertEqual(result.rolls, [1, 6, 3, 5])
+        self.assertEqual(sorted(result.kept), [3, 5, 6])
+        self.assertEqual(result.dropped, [1])
+        self.assertIsInstance(result.rolls_raw, array)
+        self.assertEqual(result.rolls_raw.typecode, "b")
+
+    def test_list_attributes_can_be_edited_in_place(self):
+        result = RollResult(2, 6, [3, 4])
+        result.rolls.append(6)
+        self.assertEqual(result.rolls, [3, 4, 6])
+        result.kept.append(1)
+        self.assertEqual(result.kept, [3, 4, 6, 1])
+        self.assertEqual(result.subtotal, 14)
+
+    def test_uppercase_keep_and_drop_types(self):
+        cases = [
+            ({"keep_type": "H", "keep_n": 2}, [5, 6]),
+            ({"keep_operations": [("H", 2)]}, [5, 6]),
+            ({"keep_operations": [("L", 2)]}, [1, 3]),
+            ({"drop_operations": [("H", 1)]}, [1, 3, 5]),
+        ]
+        for kwargs, kept in cases:
+            with self.subTest(**kwargs):
+                result = RollResult(4, 6, [1, 5, 3, 6], **kwargs)
+                self.assertEqual(sorted(result.kept), kept)
+
+    def test_values_too_large_for_arrays_stay_in_a_list(self):
+        result = RollResult(1, 0, [10**30])
+        self.assertEqual(result.rolls, [10**30])
+        self.assertEqual(result.rolls_raw, [10**30])
+        self.assertEqual(result.subtotal, 10**30)
+
+    def test_result_objects_have_no_instance_dict(self):
+        self.mock_randint.side_effect = [4, 2]
+        result_set = Dice.roll("1d6", modifiers={"Bonus": "1d4"})
+        for obj in (result_set, result_set.results[0], result_set.modifiers[0]):
+            with self.subTest(type=type(obj).__name__):
+                self.assertFalse(hasattr(obj, "__dict__"))
+
+    def test_result_set_totals_follow_results(self):
+        self.mock_randint.side_effect = [3, 4, 5]
+        result_set = Dice.roll("2d6")
+        self.assertEqual(result_set.total, 7)
+        result_set.results.append(Dice.roll("1d6").results[0])
+        self.assertEqual(result_set.subtotal, 12)
+        self.assertEqual(result_set.total, 12)
+
+    def test_assigning_rolls_refreshes_result_string(self):
+        self.mock_randint.side_effect = [1, 6, 3, 5]
+        result = Dice.roll("4d6kh3").results[0]
+        self.assertEqual(str(result), "14 (4d6kh3: 1, 6, 3, 5)")
+        result.kept = [6, 6, 6]
+        self.assertEqual(str(result), "18 (4d6kh3: 1, 6, 3, 5)")
+
+    def test_assigning_attributes_refreshes_result_string(self):
+        result = RollResult(4, 6, [1, 6, 3, 5], keep_operations=[("h", 3)])
+        self.assertEqual(str(result), "14 (4d6kh3: 1, 6, 3, 5)")
+        result.multiply = 2
+        self.assertEqual(str(result), "14 (4d6kh3: 1, 6, 3, 5) x 2")
+        result.multiply = 1
+        result.explode_target = 6
+        self.assertEqual(str(result), "14 (4d6kh3e6: 1, 6, 3, 5)")
+        result.keep_operations = [("h", 2)]
+        self.assertEqual(str(result), "14 (4d6kh2e6: 1, 6, 3, 5)")
+        self.assertEqual(result.kept, [3, 5, 6])
+
+
+class TestRollMany(TestDiceBase):
+    def test_roll_many_stores_totals_and_faces(self):
+        self.mock_randint.side_effect = [6, 3, 1, 4, 4, 2]
+        batch = Dice.roll_many("3d6kh2 + 1", 2)
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(list(batch.totals), [10, 9])
+        self.assertEqual(batch.rolls(0), [6, 3, 1])
+        self.assertEqual(batch.rolls(-1), [4, 4, 2])
+        self.assertEqual(batch.mean(), 9.5)
+        self.assertIsInstance(batch.totals, array)
+
+    def test_roll_many_matches_repeated_rolls(self):
+        rng = random.Random(7)
+        expected = [Dice.roll("2d6 x 2", rng=rng).total for _ in range(5)]
+        batch = Dice.roll_many("2d6 x 2", 5, rng=random.Random(7))
+        self.assertEqual(list(batch.totals), expected)
+
+    def test_bulk_terms_total_like_repeated_rolls(self):
+        exprs = ("4d6kh3", "3d6", "4d6kl1", "2d6kh0", "3d6kh5", "10d10kh2", "0d6")
+        for expr in exprs:
+            with self.subTest(expr=expr):
+                rng = random.Random(5)
+                expected = [Dice.roll(expr, rng=rng) for _ in range(20)]
+                batch = Dice.roll_many(expr, 20, rng=random.Random(5))
+                self.assertEqual(list(batch.totals), [r.total for r in expected])
+                self.assertEqual(
+                    [batch.rolls(i) for i in range(20)],
+                    [r.results[0].rolls for r in expected],
+                )
+
+    def test_roll_many_with_no_rolls(self):
+        batch = Dice.roll_many("1d6", 0)
+        self.assertEqual(len(batch), 0)
+        with self.assertRaises(IndexError):
+            batch.rolls(0)
+        with self.assertRaises(ValueError):
+            batch.mean()
+        with self.assertRaises(ValueError):
+            Dice.roll_many("1d6", -1)
+
+    def test_roll_many_requires_an_integer_count(self):
+        for expr in ("1d6", "1d6 + 2"):
+            for n in (2.5, "3", None):
+                with self.subTest(expr=expr, n=n):
+                    with self.assertRaises(TypeError):
+                        Dice.roll_many(expr, n)
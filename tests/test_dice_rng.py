@@ -24,7 +24,7 @@ from unittest.mock import Mock
 import pytest
 
 from wyrdbound_dice import Dice, RollResultSet
-from wyrdbound_dice.dice import _randint
+from wyrdbound_dice.dice import DiceRoller, _randint
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -50,6 +50,17 @@ def test_randint_fallback_uses_stdlib():
         assert 1 <= result <= 6
 
 
+def test_stdlib_draws_match_random_randint():
+    """Without an rng, dice consume the global stream exactly like randint."""
+    random.seed(1234)
+    expected = [random.randint(1, 6) for _ in range(20)]
+    expected += [random.randint(0, 9) for _ in range(5)]
+    random.seed(1234)
+    actual = DiceRoller.roll_standard_dice(6, 20)
+    actual += [_randint(None, 0, 9) for _ in range(5)]
+    assert actual == expected
+
+
 # ---------------------------------------------------------------------------
 # T004 — _randint with rng: calls rng.random() exactly once
 # ---------------------------------------------------------------------------
@@ -65,6 +76,58 @@ def test_randint_calls_rng_random():
     assert 1 <= result <= 6
 
 
+# ---------------------------------------------------------------------------
+# Batched rolling draws the same sequence as rolling die by die
+# ---------------------------------------------------------------------------
+
+
+def test_roll_standard_dice_matches_single_die_sequence():
+    """roll_standard_dice must consume the rng exactly like repeated _randint."""
+    expected_rng = random.Random(7)
+    expected = [_randint(expected_rng, 1, 20) for _ in range(50)]
+    assert DiceRoller.roll_standard_dice(20, 50, rng=random.Random(7)) == expected
+
+
+def test_roll_fudge_dice_matches_single_die_sequence():
+    """roll_fudge_dice must produce the same faces as repeated roll_fudge_die."""
+    expected_rng = random.Random(11)
+    expected = [DiceRoller.roll_fudge_die(rng=expected_rng) for _ in range(30)]
+    raw, effective = DiceRoller.roll_fudge_dice(30, rng=random.Random(11))
+    assert list(zip(raw, effective)) == expected
+
+
+def test_roll_percentile_dice_matches_single_die_sequence():
+    """roll_percentile_dice must draw tens and ones dice in the same order."""
+    expected_rng = random.Random(13)
+    expected = [DiceRoller.roll_percentile_die(rng=expected_rng) for _ in range(30)]
+    totals, pairs = DiceRoller.roll_percentile_dice(30, rng=random.Random(13))
+    assert [(t, tens, ones) for t, (tens, ones) in zip(totals, pairs)] == expected
+
+
+def test_roll_with_conditions_matches_single_die_sequence():
+    """Rerolls and explosions must consume the rng in die-by-die order."""
+    expected_rng = random.Random(17)
+    expected_rolls, expected_all = [], []
+    for _ in range(40):
+        value = _randint(expected_rng, 1, 6)
+        expected_all.append(value)
+        if value <= 2:  # reroll once
+            value = _randint(expected_rng, 1, 6)
+            expected_all.append(value)
+        total = value
+        while value >= 5:  # explode on 5+
+            value = _randint(expected_rng, 1, 6)
+            expected_all.append(value)
+            total += value
+        expected_rolls.append(total)
+
+    rolls, all_rolls = DiceRoller.roll_standard_dice_with_conditions(
+        6, 40, "<=", 2, 1, ">=", 5, Dice._cmp_funcs, rng=random.Random(17)
+    )
+    assert rolls == expected_rolls
+    assert all_rolls == expected_all
+
+
 # ---------------------------------------------------------------------------
 # T005 — [US1] Dice.roll() accepts rng=None without TypeError
 # ---------------------------------------------------------------------------
@@ -68,3 +68,15 @@ class TestDiceSystemShorthands(TestDiceBase):
         self.mock_randint.side_effect = [0, 5]
         r = Dice.roll("PERCENTILE")
         self.assertTotalAndDescription(r, 5, "5 = 5 (1d%: [00, 5])")
+
+    def test_multiple_shorthands_in_one_expression(self):
+        self.mock_randint.side_effect = [6, 3, 1, 6, 3, 1]
+        r = Dice.roll("BOON + BANE")
+        self.assertTotalAndDescription(
+            r, 13, "13 = 9 (3d6kh2: 6, 3, 1) + 4 (3d6kl2: 6, 3, 1)"
+        )
+
+    def test_shorthand_keeps_case_of_surrounding_dice(self):
+        self.mock_randint.side_effect = [2, 3, 1]
+        r = Dice.roll("1d4 + flux")
+        self.assertTotalAndDescription(r, 4, "4 = 2 (1d4: 2) + 3 (1d6: 3) - 1 (1d6: 1)")
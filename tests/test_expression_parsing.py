@@ -1,6 +1,19 @@
+from unittest import mock
+
 from test_base import TestDiceBase
 
-from wyrdbound_dice import Dice
+from wyrdbound_dice import Dice, DivisionByZeroError
+from wyrdbound_dice.dice import ExpressionProcessor
+from wyrdbound_dice.expression_lexer import ExpressionLexer, tokenize
+from wyrdbound_dice.expression_program import (
+    OP_ADD,
+    OP_MUL,
+    OP_PUSH,
+    OP_ROLL,
+    OP_SUB,
+    ExpressionProgram,
+    ProgramCompiler,
+)
 
 
 class TestExpressionParsing(TestDiceBase):
@@ -69,3 +82,161 @@ class TestMathematicalPrecedence(TestDiceBase):
         self.mock_randint.side_effect = [1, 5]
         r = Dice.roll("2d6 + 7 x 4 x 2")
         self.assertTotalAndDescription(r, 62, "62 = 6 (2d6: 1, 5) + (7 x 4) x 2")
+
+    def test_parser_selection(self):
+        cases = {
+            "1d20": False,
+            "4d6kh3": False,
+            "3d6r1": False,
+            "1d6+2": True,
+            "1d6 - 1d4": True,
+            "2d6 x 2": True,
+            "1d8/2": True,
+            "1d6×2": True,
+        }
+        for expr, expected in cases.items():
+            with self.subTest(expr=expr):
+                self.assertEqual(
+                    ExpressionProcessor.should_use_precedence_parsing(expr), expected
+                )
+
+
+class TestExpressionProgram(TestDiceBase):
+    """Compiled opcode programs must evaluate exactly like the expression tree."""
+
+    def _parse(self, expr):
+        return Dice._parse_with_precedence(expr)
+
+    def test_program_matches_tree_evaluation(self):
+        """Value, description and dice results agree for mixed expressions."""
+        cases = [
+            ("2d6 + 7 x 4 x 2", [1, 5]),
+            ("1d20 / 2 / 3 x 2", [3]),
+            ("-(1d6 + 2) x 3 - -4", [4]),
+            ("2d10 - 7 / 4 - 1d4", [7, 4, 1]),
+        ]
+        for expr, rolls in cases:
+            with self.subTest(expr=expr):
+                tree = self._parse(expr)
+                program = ProgramCompiler.compile(tree)
+
+                self.mock_randint.side_effect = rolls
+                expected = tree.evaluate(Dice)
+                self.mock_randint.side_effect = rolls
+                actual = program.evaluate(Dice)
+
+                self.assertEqual(actual.value, expected.value)
+                self.assertEqual(actual.description, expected.description)
+                self.assertEqual(
+                    [str(r) for r in actual.dice_results],
+                    [str(r) for r in expected.dice_results],
+                )
+
+    def test_value_run_describes_like_full_evaluation(self):
+        """roll() gives the value and dice; describe() rebuilds the text."""
+        program = ProgramCompiler.compile(self._parse("-(1d6 + 2) x 3 - 2d4 / 2"))
+        self.mock_randint.side_effect = [4, 1, 3]
+        expected = program.evaluate(Dice)
+        self.mock_randint.side_effect = [4, 1, 3]
+        value, dice_results = program.roll(Dice)
+        self.assertEqual(value, expected.value)
+        self.assertEqual(
+            [str(r) for r in dice_results], [str(r) for r in expected.dice_results]
+        )
+        self.assertEqual(program.describe(dice_results), expected.description)
+
+    def test_dice_free_subexpressions_are_folded_for_value_runs(self):
+        program = ProgramCompiler.compile(self._parse("2d6 + 7 x 4 x 2 - -(3)"))
+        self.assertEqual(
+            list(program.value_codes), [OP_ROLL, OP_PUSH, OP_ADD, OP_PUSH, OP_SUB]
+        )
+        self.assertEqual(program.value_consts, ("2d6", 56, -3))
+        self.assertEqual(program.consts, ("2d6", 7, 4, 2, 3))
+
+        self.mock_randint.side_effect = [1, 5]
+        value, dice_results = program.roll(Dice)
+        self.assertEqual(value, 65)
+        self.assertEqual(
+            program.describe(dice_results), "6 (2d6: 1, 5) + (7 x 4) x 2 + 3"
+        )
+
+    def test_division_by_zero_is_not_folded(self):
+        program = ProgramCompiler.compile(self._parse("1d6 + 1 / 0"))
+        self.assertEqual(program.value_codes, program.codes)
+        self.mock_randint.side_effect = [4]
+        with self.assertRaises(DivisionByZeroError):
+            program.roll(Dice)
+        self.assertEqual(self.mock_randint.call_count, 1)
+
+    def test_description_is_built_when_printed(self):
+        self.mock_randint.side_effect = [3, 4]
+        with mock.patch.object(
+            ExpressionProgram, "describe", autospec=True, return_value="desc"
+        ) as describe:
+            r = Dice.roll("1d6 x 2 + 1d4")
+            self.assertEqual(r.total, 10)
+            describe.assert_not_called()
+            self.assertEqual(str(r), "10 = desc")
+            self.assertEqual(str(r), "10 = desc")
+        describe.assert_called_once()
+
+    def test_program_is_postfix(self):
+        """Operands are emitted before their operators."""
+        program = ProgramCompiler.compile(self._parse("1 + 2 x 3"))
+        self.assertEqual(
+            list(program.codes), [OP_PUSH, OP_PUSH, OP_PUSH, OP_MUL, OP_ADD]
+        )
+        self.assertEqual(program.consts, (1, 2, 3))
+
+
+class TestTokenize(TestDiceBase):
+    """The fast path must tokenize exactly like ExpressionLexer."""
+
+    def _lex(self, expr):
+        try:
+            return ExpressionLexer(expr).tokenize()
+        except Exception as e:
+            return type(e), str(e)
+
+    def _fast(self, expr):
+        try:
+            return tokenize(expr)
+        except Exception as e:
+            return type(e), str(e)
+
+    def test_matches_expression_lexer(self):
+        """Tokens, positions and errors agree with the character lexer."""
+        cases = [
+            "2d6 + 7 x 4 x 2",
+            "1d20 / 2 / 3 * 2",
+            "-(1d6 + 2) x 3 - -4",
+            "4d6kh3 + 2d20kl1 - 1",
+            "4dF + 1",
+            "3df - 2",
+            "2d6r<=2 + 1d8ro1 x 2",
+            "1d6e + 1d10e>=9 - 007",
+            "12d6 + 1",
+            "2d6k",
+            "2d6r",
+            "2d6r>=",
+            "2d6r2",
+            "2d6r<3 + 2d6kk2",
+            "1d6r1o<=2e>5kh1 x 3",
+            "1d6 ^ 2",
+            "2d6\t+ 1",
+            "２d6 × 3 ÷ 2 − 1",
+            "１d２０ ＋ ５",
+            "1d6 + é",
+            "",
+        ]
+        for expr in cases:
+            with self.subTest(expr=expr):
+                self.assertEqual(self._fast(expr), self._lex(expr))
+
+    def test_token_kinds(self):
+        """Operator and operand checks classify every token of an expression."""
+        tokens = tokenize("(1d6 + 2) x 3 / -4")
+        self.assertEqual(
+            [t.value for t in tokens if t.is_operator()], ["+", "x", "/", "-"]
+        )
+        self.assertEqual([t.value for t in tokens if t.is_operand()], ["1d6", 2, 3, 4])